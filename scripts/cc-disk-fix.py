@@ -9,6 +9,11 @@ Executes cleanup actions with safety guarantees:
 
 Usage:
     python3 cc-disk-fix.py <action> [--preview] [--confirm] [--days N]
+    python3 cc-disk-scan.py --json > scan.json
+    python3 cc-disk-fix.py <action> --from-report scan.json [--confirm]
+
+    python3 cc-disk-fix.py plan <action> <action>... [--confirm]
+    python3 cc-disk-fix.py free --target 2G [--confirm]
 
 Actions:
     DELETE-cache-dirs         Clear debug, shell-snapshots, paste-cache, etc.
@@ -18,29 +23,129 @@ Actions:
     DELETE-orphaned-projects  Remove project data for paths that no longer exist
     DELETE-old-sessions       Delete old session files (--days N, default 30)
     DELETE-auth-config        Backup and move aside ~/.claude.json (requires re-login)
+    SLIM-claude-json          Keep the newest N history entries per project (--keep N, default 50)
     disable-nonessential      Set CLAUDE_CODE_DISABLE_NONESSENTIAL_TRAFFIC=1
     set-cleanup-period        Set cleanupPeriodDays in settings.json
-    list-backups              List available backups
-    restore-backup            Restore from a backup (--timestamp TIMESTAMP)
+    plan                      Run several DELETE-* actions with one walk and one backup
+    free                      Delete the cheapest candidates that get ~/.claude under --target SIZE
+    list-backups              List available backups (--verify re-measures them)
+    restore-backup            Restore from a backup (--timestamp TIMESTAMP [--path GLOB])
+    gc-backups                Delete deduplicated backup objects no backup references
+    purge-trash               Delete what --background-delete staged in ~/.claude/.trash
+    prune-backups             Delete old backups (--keep-last/--keep-daily/--keep-weekly, --max-total-size)
 """
 
 import argparse
+import bisect
+import ctypes
+import fnmatch
+import gzip
+import hashlib
+import importlib.util
 import json
 import os
 import platform
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from types import ModuleType
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 # Type alias for result dictionaries - flexible to handle various return shapes
 ResultDict = Dict[str, object]
+# One path an action would remove, as in a result's "files" or a report's file_preview
+FileInfo = Dict[str, Union[str, int, float]]
+# One list-backups entry: names and dates, sizes and counts, and with --verify the problems found
+BackupInfo = Dict[str, Any]
 
 # Centralized backup location
 BACKUP_ROOT = Path.home() / ".claude-backups"
 
+# Manifests are journaled as NDJSON while a backup runs, then compacted
+MANIFEST_NAME = "manifest.json"
+MANIFEST_JOURNAL_NAME = "manifest.ndjson"
+MANIFEST_SYNC_EVERY = 64  # journal entries per fsync
+CHECKPOINT_NAME = "checkpoint.ndjson"  # progress of an unfinished run, for --resume
+CHECKPOINT_BATCH = 512  # top-level paths deleted between checkpoint records
+BACKUP_INDEX_NAME = "index.json"  # per-backup summaries, so list-backups never walks the backups
+ARCHIVE_INDEX_SUFFIX = ".index.json"  # next to each tarball: member -> offset, gzip member -> offset
+
+# --backup-mode dedup stores file contents once, by SHA-256, under the backup root
+OBJECTS_DIR_NAME = "objects"
+OBJECT_GC_GRACE_SECONDS = 3600  # never collect objects this fresh; a backup may be adopting them
+
+# Backup archives are gzip'd in independent blocks on a thread pool
+GZIP_BLOCK_SIZE = 1024 * 1024
+DEFAULT_COMPRESS_LEVEL = 6
+DEFAULT_COMPRESS_THREADS = os.cpu_count() or 1
+
+# Deletions unlink files on a thread pool, a batch of names per task
+DEFAULT_DELETE_THREADS = min(16, (os.cpu_count() or 1) * 2)
+DELETE_BATCH_SIZE = 256
+DIR_FD_DELETE = os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd
+
+# --throttle: unlinks/s when --throttle-unlinks is not given
+DEFAULT_THROTTLE_UNLINKS = 500
+IOPRIO_CLASS_IDLE = 3
+IOPRIO_SET_SYSCALL = {"x86_64": 251, "aarch64": 30, "i386": 289, "i686": 289, "armv7l": 314}
+
+# --background-delete renames victims here and leaves the unlinks to a detached purge-trash
+TRASH_DIR_NAME = ".trash"
+STAGING_MARKER = ".staging"  # in a staging dir while its run is still renaming into it; holds the pid
+
+# Actions a plan can combine: they only remove paths below ~/.claude
+PLAN_ACTIONS = [
+    "DELETE-cache-dirs",
+    "DELETE-debug-logs",
+    "DELETE-old-plugin-versions",
+    "DELETE-plugin-cache",
+    "DELETE-orphaned-projects",
+    "DELETE-old-sessions",
+]
+
+# free picks from these; plugin-cache is left out as it wipes every installed plugin
+FREE_ACTIONS = [
+    "DELETE-cache-dirs",
+    "DELETE-debug-logs",
+    "DELETE-old-plugin-versions",
+    "DELETE-orphaned-projects",
+    "DELETE-old-sessions",
+]
+FILE_ACTIONS = ("DELETE-debug-logs", "DELETE-old-sessions")
+
+# Cost per byte freed by free, by the scanner's ACTION_SAFETY level
+SAFETY_COST = {"safe": 1.0, "caution": 4.0, "destructive": 16.0}
+# ...times up to 1 + RECENCY_COST for data written today; at most the ratio between safety levels
+RECENCY_COST = 3.0
+
+# Shared scanning machinery lives in the sibling scanner script
+SCANNER_PATH = Path(__file__).resolve().parent / "cc-disk-scan.py"
+_scanner_module: Optional[ModuleType] = None
+
+
+def load_scanner() -> ModuleType:
+    """Import cc-disk-scan.py, which is not importable by name (hyphenated)."""
+    global _scanner_module
+    if _scanner_module is None:
+        spec = importlib.util.spec_from_file_location("cc_disk_scan", SCANNER_PATH)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load scanner: {SCANNER_PATH}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module  # dataclasses resolve their module here
+        spec.loader.exec_module(module)
+        _scanner_module = module
+    return _scanner_module
+
 
 def format_size(bytes_val: int) -> str:
     """Format bytes as human-readable string."""
@@ -53,78 +158,696 @@ def format_size(bytes_val: int) -> str:
     return f"{bytes_val}B"
 
 
-def get_file_age_days(path: Path) -> int:
-    """Get file age in days."""
-    if not path.exists():
-        return 0
-    mtime = path.stat().st_mtime
-    age_seconds = datetime.now().timestamp() - mtime
-    return int(age_seconds / 86400)
+def parse_size(text: str) -> int:
+    """Parse a size like 500M, 2G or 1.5GB into bytes."""
+    units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", text.upper())
+    if not match:
+        raise ValueError(f"invalid size: {text!r}")
+    return int(float(match.group(1)) * units[match.group(2)])
+
+
+def copy_range(src, dst, start: int, end: int, chunk_size: int = 1024 * 1024) -> None:
+    """Copy bytes [start, end) between binary files in bounded chunks."""
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        data = src.read(min(chunk_size, remaining))
+        if not data:
+            break
+        dst.write(data)
+        remaining -= len(data)
+
+
+def gzip_member(block: bytes, level: int) -> bytes:
+    """Compress one block as a complete gzip member."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip header and trailer
+    return compressor.compress(block) + compressor.flush()
+
+
+class TokenBucket:
+    """Blocking rate limiter shared by every thread of a run.
+
+    take(n) spends n tokens, which refill at rate per second up to one
+    second's worth. A caller that overdraws sleeps until the debt is
+    repaid, so later callers queue up behind it.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def take(self, n: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.waited += wait
+        if wait:
+            time.sleep(wait)
+
+
+def lower_priority() -> List[str]:
+    """Put this process (and the threads and children it starts later) in the background.
+
+    Returns what was applied: idle I/O class via ioprio_set on Linux, and
+    the lowest CPU priority wherever os.setpriority exists.
+    """
+    applied = []
+    syscall_nr = IOPRIO_SET_SYSCALL.get(platform.machine())
+    if sys.platform.startswith("linux") and syscall_nr is not None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        # IOPRIO_WHO_PROCESS (1), this process (0), idle class with no level
+        if libc.syscall(syscall_nr, 1, 0, IOPRIO_CLASS_IDLE << 13) == 0:
+            applied.append("ioprio:idle")
+    if hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, 19)
+            applied.append("nice:19")
+        except OSError:
+            pass
+    return applied
+
+
+class ParallelGzipWriter:
+    """Write-only file object that gzips its input on a thread pool.
+
+    Input is cut into GZIP_BLOCK_SIZE blocks, each compressed as its own
+    gzip member (zlib releases the GIL, so members compress in parallel)
+    and written in order. A concatenation of gzip members is a valid gzip
+    stream, so tar -xz, gzip -d and tarfile read it unchanged. Writers
+    of many small files can share one pool, which close() leaves running.
+    """
+
+    def __init__(
+        self, fileobj: IO[bytes], level: int = DEFAULT_COMPRESS_LEVEL, threads: int = 1,
+        block_size: int = GZIP_BLOCK_SIZE, throttle: Optional[TokenBucket] = None,
+        pool: Optional[ThreadPoolExecutor] = None,
+    ):
+        self.fileobj = fileobj
+        self.throttle = throttle  # paces input, i.e. how fast the archived files are read
+        self.level = level
+        self.block_size = block_size
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.sha256 = hashlib.sha256()  # of the compressed output, i.e. the archive file
+        # (uncompressed offset, compressed offset) where each gzip member starts
+        self.blocks: List[Tuple[int, int]] = []
+        self._buffer = bytearray()
+        self._owns_pool = pool is None and threads > 1
+        self._pool = ThreadPoolExecutor(max_workers=threads) if self._owns_pool else pool
+        self._pending: Deque[Tuple[int, Future]] = deque()
+        self._max_pending = threads * 2  # bounds memory to a few blocks per thread
+
+    def write(self, data: bytes) -> int:
+        if self.throttle is not None:
+            self.throttle.take(len(data))
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        start = self.bytes_in
+        self.bytes_in += len(block)
+        if self._pool is None:
+            self._emit(start, gzip_member(block, self.level))
+            return
+        self._pending.append((start, self._pool.submit(gzip_member, block, self.level)))
+        while len(self._pending) > self._max_pending:
+            self._emit_next()
+
+    def _emit_next(self) -> None:
+        start, future = self._pending.popleft()
+        self._emit(start, future.result())
+
+    def _emit(self, start: int, member: bytes) -> None:
+        self.blocks.append((start, self.bytes_out))
+        self.fileobj.write(member)
+        self.sha256.update(member)
+        self.bytes_out += len(member)
+
+    def close(self) -> None:
+        """Compress what is buffered and wait for every block; the fileobj stays open."""
+        if self._buffer or self.bytes_in == 0:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._emit_next()
+        if self._owns_pool:
+            self._pool.shutdown()  # type: ignore[union-attr]
+
+    def __enter__(self) -> "ParallelGzipWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _extract_member(tar: tarfile.TarFile, member: tarfile.TarInfo, dest: Path) -> None:
+    if hasattr(tarfile, "data_filter"):
+        tar.extract(member, dest, filter="data")
+    else:
+        tar.extract(member, dest)
+
+
+def extract_matching(archive: Path, dest: Path, match: Callable[[str], bool]) -> List[str]:
+    """Extract the members of a tarball whose name passes match; returns their names.
+
+    With the archive's member index, each member is read by seeking to the
+    gzip member that holds its header, so only the blocks that hold the
+    wanted members are decompressed. Without an index, the whole archive
+    is streamed once.
+    """
+    index_path = archive.with_name(archive.name + ARCHIVE_INDEX_SUFFIX)
+    extracted = []
+    if not index_path.exists():
+        # tarfile's own "r|gz" stops after the first gzip member; GzipFile reads them all
+        with gzip.open(archive, "rb") as stream, tarfile.open(fileobj=stream, mode="r|") as tar:  # type: ignore[call-overload]
+            for member in tar:
+                if match(member.name):
+                    _extract_member(tar, member, dest)
+                    extracted.append(member.name)
+        return extracted
+
+    with open(index_path, "r") as f:
+        index = json.load(f)
+    blocks = index["blocks"]
+    starts = [start for start, _ in blocks]
+    wanted = sorted((offset, name) for name, offset in index["members"].items() if match(name))
+    with open(archive, "rb") as raw:
+        for offset, name in wanted:
+            start, compressed = blocks[bisect.bisect_right(starts, offset) - 1]
+            raw.seek(compressed)
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+            stream.seek(offset - start)
+            with tarfile.open(fileobj=stream, mode="r|") as tar:  # type: ignore[call-overload]
+                member = tar.next()
+                if member is not None:
+                    _extract_member(tar, member, dest)
+                    extracted.append(name)
+    return extracted
+
+
+class DeletionEngine:
+    """Delete files and whole trees with unlinks spread over a thread pool.
+
+    Trees are walked with scandir on a directory fd and each batch of
+    names is unlinked relative to that fd, so no unlink re-resolves a full
+    path. Directories are removed bottom-up once every file is gone.
+    Errors are collected per path instead of aborting the run.
+    """
+
+    def __init__(self, threads: int = DEFAULT_DELETE_THREADS, throttle: Optional[TokenBucket] = None) -> None:
+        self.threads = threads
+        self.throttle = throttle  # unlinks (and rmdirs) per second
+        self.files_removed = 0
+        self.dirs_removed = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+        self._fd_batches: Dict[int, int] = {}  # open dir fd -> batches still using it
+
+    def remove(self, paths: List[Path]) -> Dict[Path, List[str]]:
+        """Delete every path (file, symlink or tree); returns the errors of each path that failed."""
+        start = time.perf_counter()
+        errors: Dict[Path, List[str]] = {path: [] for path in paths}
+        dirs: List[Tuple[str, Path]] = []
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            for top in paths:
+                self._walk(pool, top, errors[top], dirs, pending)
+            for future in pending:
+                future.result()
+
+        # Children were walked after their parents, so reversed order is bottom-up
+        for path, top in reversed(dirs):
+            if self.throttle is not None:
+                self.throttle.take(1)
+            try:
+                os.rmdir(path)
+                self.dirs_removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                if not errors[top]:  # otherwise a failed unlink below explains it
+                    errors[top].append(f"{path}: {e}")
+
+        self.seconds += time.perf_counter() - start
+        for top in paths:
+            if not errors[top] and os.path.lexists(top):
+                errors[top].append(f"{top}: still exists after delete")
+        return {top: errs for top, errs in errors.items() if errs}
+
+    def _walk(
+        self, pool: ThreadPoolExecutor, top: Path, errors: List[str],
+        dirs: List[Tuple[str, Path]], pending: Deque[Future],
+    ) -> None:
+        try:
+            st = os.lstat(top)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            errors.append(f"{top}: {e}")
+            return
+        if not stat.S_ISDIR(st.st_mode):
+            self._submit(pool, pending, None, str(top.parent), [top.name], errors)
+            return
+
+        stack = [str(top)]
+        while stack:
+            path = stack.pop()
+            dirs.append((path, top))
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW) if DIR_FD_DELETE else None
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+                continue
+            names = []
+            try:
+                with os.scandir(fd if fd is not None else path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(os.path.join(path, entry.name))
+                        else:
+                            names.append(entry.name)
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+            batches = [names[i:i + DELETE_BATCH_SIZE] for i in range(0, len(names), DELETE_BATCH_SIZE)]
+            if fd is not None:
+                if not batches:
+                    os.close(fd)
+                    continue
+                self._fd_batches[fd] = len(batches)
+            for batch in batches:
+                self._submit(pool, pending, fd, path, batch, errors)
+
+    def _submit(
+        self, pool: ThreadPoolExecutor, pending: Deque[Future], fd: Optional[int],
+        path: str, names: List[str], errors: List[str],
+    ) -> None:
+        pending.append(pool.submit(self._unlink_batch, fd, path, names, errors))
+        while len(pending) > self.threads * 4:  # bounds open dir fds while the walk runs ahead
+            pending.popleft().result()
+
+    def _unlink_batch(self, fd: Optional[int], path: str, names: List[str], errors: List[str]) -> None:
+        removed = 0
+        try:
+            for name in names:
+                if self.throttle is not None:
+                    self.throttle.take(1)
+                try:
+                    if fd is not None:
+                        os.unlink(name, dir_fd=fd)
+                    else:
+                        os.unlink(os.path.join(path, name))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    errors.append(f"{os.path.join(path, name)}: {e}")
+        finally:
+            with self._lock:
+                self.files_removed += removed
+                if fd is not None:
+                    self._fd_batches[fd] -= 1
+                    if not self._fd_batches[fd]:
+                        del self._fd_batches[fd]
+                        os.close(fd)
+
+    def stats(self) -> Optional[Dict[str, Union[int, float]]]:
+        """Throughput of the deletions so far, or None if nothing was deleted."""
+        if not self.files_removed and not self.dirs_removed:
+            return None
+        return {
+            "files": self.files_removed,
+            "dirs": self.dirs_removed,
+            "seconds": round(self.seconds, 3),
+            "files_per_sec": round(self.files_removed / max(self.seconds, 1e-6)),
+            "threads": self.threads,
+        }
+
+
+def same_filesystem(a: Path, b: Path) -> bool:
+    """Whether os.rename can move entries between a and b without copying."""
+    return os.stat(a).st_dev == os.stat(b).st_dev
+
 
+def load_report(source: str) -> Tuple[Dict[str, List[FileInfo]], Optional[int]]:
+    """Read a cc-disk-scan.py --json report ("-" for stdin).
+
+    Returns (candidates per action, size of ~/.claude at scan time or None).
+    """
+    if source == "-":
+        report = json.load(sys.stdin)
+    else:
+        with open(source, "r") as f:
+            report = json.load(f)
+    candidates = {
+        action["id"]: action.get("file_preview", [])
+        for action in report.get("actions", [])
+    }
+    total_size = (report.get("disk_usage") or {}).get("total_size")
+    return candidates, int(total_size) if total_size is not None else None
+
+
+def restat_candidates(candidates: List[FileInfo], base_dir: Path) -> Tuple[List[FileInfo], List[str]]:
+    """Split report candidates into (unchanged, reasons the others were dropped).
+
+    Costs one lstat per listed path: it must still sit below base_dir, not be
+    a symlink, and keep the mtime (and, for files, the size) recorded by the
+    scan. Directory contents are deliberately not re-walked.
+    """
+    fresh: List[FileInfo] = []
+    stale: List[str] = []
+    base = base_dir.resolve()
+    for info in candidates:
+        path = Path(str(info["path"]))
+        try:
+            if path.resolve() == base:
+                raise ValueError
+            path.resolve().relative_to(base)
+        except ValueError:
+            stale.append(f"{path}: outside {base_dir}")
+            continue
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            stale.append(f"{path}: no longer exists")
+            continue
+        if stat.S_ISLNK(st.st_mode):
+            stale.append(f"{path}: is a symlink")
+        elif "mtime" not in info or st.st_mtime != info["mtime"]:
+            stale.append(f"{path}: modified since the scan")
+        elif stat.S_ISREG(st.st_mode) and st.st_size != info.get("size"):
+            stale.append(f"{path}: size changed since the scan")
+        else:
+            fresh.append(info)
+    return fresh, stale
+
+
+def drop_nested(steps: Dict[str, List[FileInfo]]) -> List[str]:
+    """Remove candidates that another candidate already deletes, e.g. logs inside debug/.
+
+    Keeps the outermost path (or the first of identical ones) so bytes are
+    counted once. Returns the paths dropped.
+    """
+    claimed: Dict[str, str] = {}
+    for action, infos in steps.items():
+        for info in infos:
+            claimed.setdefault(str(info["path"]), action)
+    dropped: List[str] = []
+    for action, infos in steps.items():
+        for info in list(infos):
+            path = str(info["path"])
+            nested = any(str(parent) in claimed for parent in Path(path).parents)
+            if nested or claimed[path] != action:
+                infos.remove(info)
+                dropped.append(path)
+    return dropped
+
+
+def read_manifest(backup_dir: Path) -> Optional[Dict[str, object]]:
+    """Load a backup's manifest.json, or replay its journal if it was never compacted.
+
+    A journal left by an interrupted run may end in a torn line; everything
+    before it is still a valid manifest.
+    """
+    manifest_path = backup_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        with open(manifest_path, "r") as f:
+            return json.load(f)
 
-def get_dir_size(path: Path) -> int:
-    """Get total size of directory in bytes. Fails on permission errors."""
-    if not path.exists():
-        return 0
-    total = 0
-    for entry in path.rglob("*"):
-        if entry.is_file():
-            # No try/except - fail fast on permission errors
-            total += entry.stat().st_size
-    return total
+    journal_path = backup_dir / MANIFEST_JOURNAL_NAME
+    if not journal_path.exists():
+        return None
+    return replay_journal(journal_path)
+
+
+def replay_journal(journal_path: Path) -> Optional[Dict[str, object]]:
+    """Rebuild a manifest from its journal: a header line, then one line per file."""
+    manifest: Optional[Dict[str, object]] = None
+    files: List[object] = []
+    with open(journal_path, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if manifest is None:
+                manifest = record
+            else:
+                files.append(record)
+    if manifest is None:
+        return None
+    manifest["files"] = files
+    return manifest
+
+
+def file_sha256(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(GZIP_BLOCK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def measure_backup(
+    backup_dir: Path, checksums: Optional[Dict[str, str]] = None, hash_files: bool = True
+) -> Dict[str, object]:
+    """Size and checksum what a backup directory holds, not counting its manifest.
+
+    Top-level files (archives, copied config files) get a SHA-256, taken
+    from checksums when the caller already computed it while writing.
+    Trees moved in by --backup-mode move are only sized.
+    """
+    known = checksums or {}
+    size = 0
+    sums: Dict[str, str] = {}
+    for dirpath, dirnames, filenames in os.walk(backup_dir):
+        top = dirpath == str(backup_dir)
+        for filename in filenames:
+            if top and filename.startswith((MANIFEST_NAME, MANIFEST_JOURNAL_NAME, CHECKPOINT_NAME)):
+                continue
+            path = os.path.join(dirpath, filename)
+            st = os.lstat(path)
+            size += st.st_size
+            if top and hash_files and stat.S_ISREG(st.st_mode):
+                sums[filename] = known.get(filename) or file_sha256(Path(path))
+    return {"size": size, "checksums": sums}
+
+
+class Checkpoint:
+    """Progress journal of one destructive run, kept in its backup dir for --resume.
+
+    The header line records the action and every planned path. One line
+    marks the backup as committed, then each batch of deletions appends
+    the paths it removed. The file is removed once every path is gone.
+    """
+
+    def __init__(self, path: Path, action: str, planned: List[FileInfo]) -> None:
+        self.path = path
+        self.action = action
+        self.planned = planned
+        self.backed_up = False
+        self.deleted: set = set()
+
+    @property
+    def backup_dir(self) -> Path:
+        return self.path.parent
+
+    @classmethod
+    def start(cls, backup_dir: Path, action: str, planned: List[FileInfo]) -> "Checkpoint":
+        checkpoint = cls(backup_dir / CHECKPOINT_NAME, action, planned)
+        checkpoint._append({"action": action, "planned": planned})
+        return checkpoint
+
+    @classmethod
+    def find(cls, backup_root: Path, action: str) -> Optional["Checkpoint"]:
+        """The newest unfinished run of an action, if any."""
+        if not backup_root.exists():
+            return None
+        for name in sorted(os.listdir(backup_root), reverse=True):
+            path = backup_root / name / CHECKPOINT_NAME
+            if not name.startswith("20") or not path.exists():
+                continue
+            checkpoint = None
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn last line of an interrupted run
+                    if checkpoint is None:
+                        checkpoint = cls(path, record["action"], record["planned"])
+                    elif record.get("backed_up"):
+                        checkpoint.backed_up = True
+                    else:
+                        checkpoint.deleted.update(record.get("deleted", []))
+            if checkpoint is not None and checkpoint.action == action:
+                return checkpoint
+        return None
+
+    def remaining(self) -> List[FileInfo]:
+        """Planned paths not yet deleted (moved-away or vanished ones drop out too)."""
+        return [
+            info for info in self.planned
+            if str(info["path"]) not in self.deleted and os.path.lexists(str(info["path"]))
+        ]
+
+    def mark_backed_up(self) -> None:
+        self.backed_up = True
+        self._append({"backed_up": True})
+
+    def mark_deleted(self, paths: List[Path]) -> None:
+        if paths:
+            self.deleted.update(str(path) for path in paths)
+            self._append({"deleted": [str(path) for path in paths]})
+
+    def finish(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def _append(self, record: Dict[str, object]) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
 
 class BackupManager:
     """Manage centralized backups in ~/.claude-backups/"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, compress_level: int = DEFAULT_COMPRESS_LEVEL, compress_threads: int = DEFAULT_COMPRESS_THREADS,
+        throttle: Optional[TokenBucket] = None,
+    ) -> None:
         self.backup_root = BACKUP_ROOT
+        self.compress_level = compress_level
+        self.compress_threads = compress_threads
+        self.throttle = throttle  # bytes/s read while backing up
+        # Totals over every archive written by this manager
+        self.compressed_in = 0
+        self.compressed_out = 0
+        self.compress_seconds = 0.0
+        # Open manifest journals: backup dir -> (file, entries not yet fsync'd)
+        self._journals: Dict[Path, Tuple[IO[str], int]] = {}
+        # SHA-256 of archives as they were written: backup dir -> {name: digest}
+        self._checksums: Dict[Path, Dict[str, str]] = {}
 
     def create_backup_dir(self) -> Path:
-        """Create timestamped backup directory, return path."""
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        backup_dir = self.backup_root / timestamp
-        backup_dir.mkdir(parents=True, exist_ok=True)
-
-        # Update 'latest' symlink
-        latest = self.backup_root / "latest"
-        if latest.is_symlink():
-            latest.unlink()
-        latest.symlink_to(timestamp)
+        """Create timestamped backup directory, return path.
+
+        Runs started in the same second get "-2", "-3", ... appended, so
+        no two runs ever share a directory and its manifest.
+        """
+        self.backup_root.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        timestamp = stamp
+        seq = 1
+        while True:
+            backup_dir = self.backup_root / timestamp
+            try:
+                backup_dir.mkdir()
+                break
+            except FileExistsError:
+                seq += 1
+                timestamp = f"{stamp}-{seq}"
+
+        # Update 'latest' symlink; replaced atomically, as another run may be doing the same
+        tmp_link = self.backup_root / f"latest.{os.getpid()}.tmp"
+        tmp_link.unlink(missing_ok=True)
+        tmp_link.symlink_to(timestamp)
+        os.replace(tmp_link, self.backup_root / "latest")
 
         return backup_dir
 
     def create_manifest(
         self, backup_dir: Path, action: str, description: str = ""
     ) -> Path:
-        """Create manifest.json in backup directory."""
-        manifest_path = backup_dir / "manifest.json"
-        manifest = {
+        """Start the manifest journal in a backup directory.
+
+        The first line is the manifest header; add_to_manifest appends one
+        line per file and commit_manifest compacts it into manifest.json.
+        """
+        journal_path = backup_dir / MANIFEST_JOURNAL_NAME
+        header = {
             "created": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "action": action,
             "description": description,
             "hostname": platform.node(),
             "user": os.getenv("USER", "unknown"),
-            "files": [],
         }
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-        return manifest_path
+        journal = open(journal_path, "a")
+        journal.write(json.dumps(header) + "\n")
+        self._journals[backup_dir] = (journal, 0)
+        self._sync_journal(backup_dir)
+        return journal_path
 
     def add_to_manifest(
-        self, backup_dir: Path, original: str, backup_name: str, size: int
+        self, backup_dir: Path, original: str, backup_name: str, size: int, moved: bool = False,
+        extra: Optional[Dict[str, Union[str, int, float]]] = None,
     ) -> None:
-        """Add file entry to manifest."""
-        manifest_path = backup_dir / "manifest.json"
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
-        manifest["files"].append({
-            "original": original,
-            "backup": backup_name,
-            "size": size,
-        })
-        with open(manifest_path, "w") as f:
+        """Append a file entry to the manifest journal.
+
+        Entries are fsync'd every MANIFEST_SYNC_EVERY lines; call
+        _sync_journal before anything that relies on them being durable.
+        """
+        journal, pending = self._journals[backup_dir]
+        entry: Dict[str, Union[str, int, float, bool]] = {"original": original, "backup": backup_name, "size": size}
+        if moved:
+            entry["moved"] = True  # renamed into the backup; restore renames it back
+        if extra:
+            entry.update(extra)
+        journal.write(json.dumps(entry) + "\n")
+        self._journals[backup_dir] = (journal, pending + 1)
+        if pending + 1 >= MANIFEST_SYNC_EVERY:
+            self._sync_journal(backup_dir)
+
+    def _sync_journal(self, backup_dir: Path) -> None:
+        journal, _ = self._journals[backup_dir]
+        journal.flush()
+        os.fsync(journal.fileno())
+        self._journals[backup_dir] = (journal, 0)
+
+    def commit_manifest(self, backup_dir: Path) -> Path:
+        """Compact the journal into manifest.json once every backup is written.
+
+        The manifest also records the backup's size, entry count and
+        archive checksums, which list-backups reads instead of walking.
+        """
+        self._sync_journal(backup_dir)
+        journal, _ = self._journals.pop(backup_dir)
+        journal.close()
+
+        manifest = replay_journal(backup_dir / MANIFEST_JOURNAL_NAME)
+        if manifest is not None:
+            summary = measure_backup(backup_dir, self._checksums.pop(backup_dir, None))
+            summary["files"] = len(manifest["files"])  # type: ignore[arg-type]
+            manifest["summary"] = summary
+        manifest_path = self._write_manifest(backup_dir, manifest)
+        (backup_dir / MANIFEST_JOURNAL_NAME).unlink()
+        if manifest is not None:
+            index = self._load_index()
+            index[backup_dir.name] = self._index_entry(manifest)
+            self._save_index(index)
+        return manifest_path
+
+    def _write_manifest(self, backup_dir: Path, manifest: Optional[Dict[str, object]]) -> Path:
+        """Atomically replace a backup's manifest.json."""
+        manifest_path = backup_dir / MANIFEST_NAME
+        tmp_path = backup_dir / (MANIFEST_NAME + ".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
+        return manifest_path
 
     def backup_file(self, backup_dir: Path, source: Path, name: str = "") -> Path:
         """Backup a single file to backup directory."""
@@ -135,108 +858,688 @@ class BackupManager:
         dest = backup_dir / backup_name
         size = source.stat().st_size
 
-        shutil.copy2(source, dest)
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            for chunk in iter(lambda: src.read(GZIP_BLOCK_SIZE), b""):
+                if self.throttle is not None:
+                    self.throttle.take(len(chunk))
+                dst.write(chunk)
+        shutil.copystat(source, dest)
         self.add_to_manifest(backup_dir, str(source), backup_name, size)
 
         return dest
 
-    def backup_dir_tar(
-        self, backup_dir: Path, source: Path, tarball_name: str
+    def backup_paths_tar(
+        self, backup_dir: Path, source: Path, paths: List[str], tarball_name: str
     ) -> Path:
-        """Backup directory as tarball."""
+        """Archive only the given paths below source, recorded so restore puts them back.
+
+        Members are stored relative to source's parent, the same layout as
+        a tarball of the whole of source, so restore can extract them in
+        place. Cost scales with what is archived, not with source. A
+        member index written next to the tarball lets restore seek to
+        single members.
+        """
         if not source.exists():
             raise FileNotFoundError(f"Cannot backup: {source} not found")
 
         dest = backup_dir / tarball_name
-        size = get_dir_size(source)
-
-        subprocess.run(
-            ["tar", "-czf", str(dest), "-C", str(source.parent), source.name],
-            check=True,
-        )
+        size = 0
+        offsets: Dict[str, int] = {}
+
+        def count(member: tarfile.TarInfo) -> tarfile.TarInfo:
+            nonlocal size
+            size += member.size
+            offsets[member.name] = tar.offset  # where this member's header is about to go
+            return member
+
+        start = time.perf_counter()
+        with open(dest, "wb") as raw, \
+                ParallelGzipWriter(raw, self.compress_level, self.compress_threads, throttle=self.throttle) as gz:
+            with tarfile.open(fileobj=gz, mode="w|") as tar:  # type: ignore[call-overload]
+                for path in paths:
+                    tar.add(path, arcname=os.path.relpath(path, source.parent), filter=count)
+        with open(dest.with_name(tarball_name + ARCHIVE_INDEX_SUFFIX), "w") as f:
+            json.dump({"blocks": gz.blocks, "members": offsets}, f)
+        self.compress_seconds += time.perf_counter() - start
+        self.compressed_in += gz.bytes_in
+        self.compressed_out += gz.bytes_out
+        self._checksums.setdefault(backup_dir, {})[tarball_name] = gz.sha256.hexdigest()
         self.add_to_manifest(backup_dir, str(source), tarball_name, size)
 
         return dest
 
-    def list_backups(self) -> List[Dict[str, str]]:
-        """List all available backups."""
-        backups = []
-        if not self.backup_root.exists():
-            return backups
+    def compression_stats(self) -> Optional[Dict[str, Union[int, float]]]:
+        """Throughput of the archives written so far, or None if there were none."""
+        if not self.compressed_in:
+            return None
+        seconds = max(self.compress_seconds, 1e-6)
+        return {
+            "bytes_in": self.compressed_in,
+            "bytes_out": self.compressed_out,
+            "ratio": round(self.compressed_out / self.compressed_in, 3),
+            "seconds": round(self.compress_seconds, 3),
+            "mb_per_sec": round(self.compressed_in / 1048576 / seconds, 1),
+            "level": self.compress_level,
+            "threads": self.compress_threads,
+        }
 
-        for item in sorted(self.backup_root.iterdir(), reverse=True):
+    def backup_paths_move(
+        self, backup_dir: Path, source: Path, files_info: List[FileInfo], name: str
+    ) -> Tuple[List[FileInfo], List[str]]:
+        """Rename paths below source into backup_dir/name, keeping their layout.
+
+        No data is copied, so this needs backup_dir on the same filesystem.
+        Each batch of moves is journaled and fsync'd before any of them
+        happens. Returns (moved, errors).
+        """
+        moved: List[FileInfo] = []
+        errors: List[str] = []
+        for start in range(0, len(files_info), MANIFEST_SYNC_EVERY):
+            batch = []
+            for info in files_info[start:start + MANIFEST_SYNC_EVERY]:
+                path = str(info["path"])
+                rel = os.path.join(name, os.path.relpath(path, source.parent))
+                self.add_to_manifest(backup_dir, path, rel, int(info["size"]), moved=True)
+                batch.append((info, path, backup_dir / rel))
+            self._sync_journal(backup_dir)
+            for info, path, dest in batch:
+                try:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    os.rename(path, dest)
+                    moved.append(info)
+                except OSError as e:
+                    errors.append(f"{path}: {e}")
+        return moved, errors
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.backup_root / OBJECTS_DIR_NAME
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def backup_paths_dedup(self, backup_dir: Path, paths: List[str]) -> Tuple[int, int]:
+        """Store every file below the given paths in the shared object store.
+
+        Each file is read once, hashed while it is compressed, and kept only
+        when its content is not stored yet, so unchanged data costs no
+        object store space. The manifest gets one entry per file or
+        symlink. Returns (bytes stored, bytes already present).
+        """
+        stored = 0
+        reused = 0
+        # One compression pool for the whole run; most session files are a single block
+        pool = ThreadPoolExecutor(max_workers=self.compress_threads) if self.compress_threads > 1 else None
+        try:
+            for top in paths:
+                walk = os.walk(top) if os.path.isdir(top) and not os.path.islink(top) else [("", [], [top])]
+                for dirpath, _, filenames in walk:
+                    for filename in filenames:
+                        path = os.path.join(dirpath, filename)
+                        st = os.lstat(path)
+                        if stat.S_ISLNK(st.st_mode):
+                            self.add_to_manifest(backup_dir, path, "", 0, extra={"symlink": os.readlink(path)})
+                            continue
+                        if not stat.S_ISREG(st.st_mode):
+                            continue
+                        digest, added = self._store_object(path, pool)
+                        if added:
+                            stored += st.st_size
+                        else:
+                            reused += st.st_size
+                        self.add_to_manifest(
+                            backup_dir, path, str(self._object_path(digest).relative_to(self.backup_root)),
+                            st.st_size,
+                            extra={"sha256": digest, "mode": stat.S_IMODE(st.st_mode), "mtime": st.st_mtime},
+                        )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return stored, reused
+
+    def _store_object(self, path: str, pool: Optional[ThreadPoolExecutor] = None) -> Tuple[str, bool]:
+        """Add a file to the object store if missing; returns (digest, added).
+
+        The file is hashed and compressed in one pass into a temp file
+        under objects/tmp/, which gc-backups reaps if a run dies, and then
+        renamed to its object path or dropped if that object exists.
+        """
+        tmp = self.objects_dir / "tmp" / f"{os.getpid()}.tmp"
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        sha = hashlib.sha256()
+        start = time.perf_counter()
+        with open(path, "rb") as src, open(tmp, "wb") as raw, ParallelGzipWriter(
+            raw, self.compress_level, self.compress_threads, throttle=self.throttle, pool=pool
+        ) as gz:
+            for chunk in iter(lambda: src.read(GZIP_BLOCK_SIZE), b""):
+                sha.update(chunk)
+                gz.write(chunk)
+        self.compress_seconds += time.perf_counter() - start
+        self.compressed_in += gz.bytes_in
+        self.compressed_out += gz.bytes_out
+        digest = sha.hexdigest()
+        obj = self._object_path(digest)
+        if obj.exists():
+            tmp.unlink()
+            os.utime(obj)  # fresh again, so a concurrent gc-backups leaves it alone
+            return digest, False
+
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, obj)
+        return digest, True
+
+    def gc_objects(self, confirm: bool) -> ResultDict:
+        """Find (and with confirm, delete) objects no backup manifest references."""
+        if not self.objects_dir.exists():
+            return {"status": "skip", "reason": f"No object store in {self.backup_root}"}
+
+        referenced = set()
+        for item in self.backup_root.iterdir():
             if item.is_dir() and item.name.startswith("20"):
-                manifest_path = item / "manifest.json"
-                entry: Dict[str, Union[str, int]] = {"timestamp": item.name, "path": str(item)}
+                manifest = read_manifest(item)
+                for entry in (manifest or {}).get("files", []):
+                    if "sha256" in entry:
+                        referenced.add(entry["sha256"])
+
+        cutoff = time.time() - OBJECT_GC_GRACE_SECONDS
+        unreferenced: List[Tuple[Path, int]] = []
+        kept = 0
+        recent = 0
+        for obj in self.objects_dir.glob("*/*"):
+            try:
+                st = obj.stat()
+            except OSError:
+                continue  # renamed into place or dropped by a concurrent backup
+            if obj.name in referenced:
+                kept += 1
+            elif st.st_mtime > cutoff:
+                kept += 1
+                recent += 1
+            else:
+                unreferenced.append((obj, st.st_size))
+        total = sum(size for _, size in unreferenced)
 
-                if manifest_path.exists():
-                    with open(manifest_path, "r") as f:
-                        manifest = json.load(f)
-                    entry["action"] = manifest.get("action", "unknown")
-                    entry["created"] = manifest.get("created", "")
-                    entry["files"] = len(manifest.get("files", []))
+        if not confirm:
+            return {
+                "status": "preview",
+                "action": "gc-backups",
+                "files": [{"path": str(obj), "size": size, "size_human": format_size(size)} for obj, size in unreferenced],
+                "total_size": total,
+                "total_size_human": format_size(total),
+                "kept": kept,
+            }
+
+        for obj, _ in unreferenced:
+            obj.unlink(missing_ok=True)
+        for fanout in self.objects_dir.iterdir():
+            try:
+                if fanout.is_dir() and not any(fanout.iterdir()):
+                    fanout.rmdir()
+            except OSError:
+                pass  # a concurrent backup just stored something there
+        return {
+            "status": "success",
+            "size_freed": total,
+            "size_freed_human": format_size(total),
+            "objects_removed": len(unreferenced),
+            "kept": kept,
+            "recent": recent,
+            "message": f"Removed {len(unreferenced)} unreferenced objects ({format_size(total)})",
+        }
 
-                # Get size
-                size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                entry["size"] = size
-                entry["size_human"] = format_size(size)
+    def prune(
+        self,
+        confirm: bool,
+        keep_last: Optional[int] = None,
+        keep_daily: Optional[int] = None,
+        keep_weekly: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+    ) -> ResultDict:
+        """Find (and with confirm, delete) backups outside the retention policy.
+
+        A backup survives if it is among the newest keep_last, or is the
+        newest of one of the most recent keep_daily days or keep_weekly ISO
+        weeks that have backups. If the survivors still exceed
+        max_total_size, the oldest are evicted as well, never the newest.
+        Backups of unfinished --confirm runs (with a checkpoint) are always
+        kept: they hold data already gone from ~/.claude and what --resume
+        needs. Sizes include the dedup objects the backups reference, and a
+        confirmed prune garbage-collects the objects left unreferenced.
+        """
+        dated: List[Tuple[datetime, BackupInfo]] = []
+        for backup in self.list_backups():  # newest first
+            seq = backup["timestamp"][19:]  # "-2" etc. for a second run in the same second
+            try:
+                if seq and not (seq[0] == "-" and seq[1:].isdigit()):
+                    raise ValueError
+                dated.append((datetime.strptime(backup["timestamp"][:19], "%Y-%m-%dT%H-%M-%S"), backup))
+            except ValueError:
+                continue  # not ours; leave it alone
+        if not dated:
+            return {"status": "skip", "reason": f"No backups in {self.backup_root}"}
+
+        keep = set()
+        if keep_last is not None or keep_daily is not None or keep_weekly is not None:
+            keep.update(b["timestamp"] for _, b in dated[:keep_last or 0])
+            for period_count, period_of in (
+                (keep_daily or 0, lambda d: d.date()),
+                (keep_weekly or 0, lambda d: d.isocalendar()[:2]),
+            ):
+                periods = set()
+                for created, backup in dated:
+                    period = period_of(created)
+                    if period not in periods and len(periods) < period_count:
+                        periods.add(period)
+                        keep.add(backup["timestamp"])
+        else:
+            keep.update(b["timestamp"] for _, b in dated)
+        unfinished = {b["timestamp"] for _, b in dated if (Path(b["path"]) / CHECKPOINT_NAME).exists()}
+        keep |= unfinished
+
+        objects = self._referenced_objects([b["timestamp"] for _, b in dated])
+
+        def footprint(backups: List[BackupInfo]) -> int:
+            """Bytes the backups hold, counting each object they reference once."""
+            shared: Dict[str, int] = {}
+            for b in backups:
+                shared.update(objects[b["timestamp"]])
+            return sum(int(b["size"]) - int(b["objects_size"]) for b in backups) + sum(shared.values())
+
+        kept = [b for _, b in dated if b["timestamp"] in keep]
+        evict = [b for _, b in dated if b["timestamp"] not in keep]
+        if max_total_size is not None:
+            evictable = [b for b in kept[1:] if b["timestamp"] not in unfinished]
+            while evictable and footprint(kept) > max_total_size:
+                oldest = evictable.pop()
+                kept.remove(oldest)
+                evict.append(oldest)
+        evict.sort(key=lambda b: b["timestamp"])  # oldest first
+        total = footprint([b for _, b in dated]) - footprint(kept)
+
+        if not confirm:
+            return {
+                "status": "preview",
+                "action": "prune-backups",
+                "files": [
+                    {"path": b["path"], "size": footprint([b]), "size_human": format_size(footprint([b])),
+                     "action": b.get("action", "unknown")}
+                    for b in evict
+                ],
+                "total_size": total,
+                "total_size_human": format_size(total),
+                "kept": [b["timestamp"] for b in kept],
+                **self._unfinished_note(unfinished),
+            }
+
+        errors = []
+        removed = 0
+        freed = 0
+        for backup in evict:
+            try:
+                shutil.rmtree(backup["path"])
+                removed += 1
+                freed += int(backup["size"]) - int(backup["objects_size"])  # objects are freed by the gc below
+            except OSError as e:
+                errors.append(f"{backup['path']}: {e}")
+        gc = self.gc_objects(confirm=True) if self.objects_dir.exists() else {}
+        freed += int(gc.get("size_freed", 0))  # type: ignore[arg-type]
+
+        latest = self.backup_root / "latest"
+        if latest.is_symlink() and not latest.exists():
+            latest.unlink()
+            if kept:
+                latest.symlink_to(kept[0]["timestamp"])
+
+        result: ResultDict = {
+            "status": "partial" if errors else "success",
+            "size_freed": freed,
+            "size_freed_human": format_size(freed),
+            "backups_removed": removed,
+            "kept": [b["timestamp"] for b in kept],
+            "message": f"Removed {removed} backups ({format_size(freed)}), kept {len(kept)}",
+            **self._unfinished_note(unfinished),
+        }
+        if "objects_removed" in gc:
+            result["objects_removed"] = gc["objects_removed"]
+        if gc.get("recent"):
+            result["note"] = (f"{gc['recent']} unreferenced objects are under an hour old and were kept; "
+                              "run gc-backups later to free them")
+        if errors:
+            result["errors"] = errors
+        return result
+
+    def _unfinished_note(self, unfinished: set) -> ResultDict:
+        """The kept_unfinished entry of a prune result, explaining why those backups stay."""
+        if not unfinished:
+            return {}
+        return {"kept_unfinished": [
+            f"{timestamp}: unfinished --confirm run; finish it with --resume first" for timestamp in sorted(unfinished)
+        ]}
+
+    def _referenced_objects(self, timestamps: List[str]) -> Dict[str, Dict[str, int]]:
+        """For each backup, the dedup objects its manifest references and their stored sizes."""
+        sizes: Dict[str, int] = {}
+        refs: Dict[str, Dict[str, int]] = {}
+        for timestamp in timestamps:
+            refs[timestamp] = {}
+            if self.objects_dir.exists():
+                refs[timestamp] = self._manifest_objects(read_manifest(self.backup_root / timestamp) or {}, sizes)
+        return refs
+
+    def _manifest_objects(self, manifest: Dict[str, object], sizes: Dict[str, int]) -> Dict[str, int]:
+        """The dedup objects one manifest references and their stored sizes, cached in sizes."""
+        refs: Dict[str, int] = {}
+        for entry in manifest.get("files", []):  # type: ignore[attr-defined]
+            if "sha256" not in entry:
+                continue
+            name = str(entry["backup"])
+            if name not in sizes:
+                try:
+                    sizes[name] = (self.backup_root / name).stat().st_size
+                except OSError:
+                    sizes[name] = 0
+            refs[name] = sizes[name]
+        return refs
+
+    def _load_index(self) -> Dict[str, Dict[str, Union[str, int]]]:
+        try:
+            with open(self.backup_root / BACKUP_INDEX_NAME, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict[str, Union[str, int]]]) -> None:
+        tmp_path = self.backup_root / f"{BACKUP_INDEX_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.backup_root / BACKUP_INDEX_NAME)
+
+    def _index_entry(self, manifest: Dict[str, object]) -> Dict[str, Union[str, int]]:
+        """What list-backups shows for a backup, from its committed manifest.
+
+        The size includes the dedup objects the backup references, as
+        prune-backups counts them; objects_size is that share of it.
+        """
+        summary = manifest["summary"]
+        objects_size = sum(self._manifest_objects(manifest, {}).values())
+        return {
+            "action": manifest.get("action", "unknown"),
+            "created": manifest.get("created", ""),
+            "files": summary["files"],  # type: ignore[index]
+            "size": summary["size"] + objects_size,  # type: ignore[index]
+            "objects_size": objects_size,
+        }
 
-                backups.append(entry)
+    def list_backups(self, verify: bool = False) -> List[BackupInfo]:
+        """List all available backups.
+
+        Sizes and counts come from the index at the backup root, falling
+        back to each manifest's summary. A size includes the dedup objects
+        the backup references, so it matches what prune-backups counts. Backups from before summaries
+        existed, or interrupted ones, are measured. With verify, every
+        backup is re-measured and checked against its recorded summary,
+        and every object a dedup backup references is re-hashed.
+        """
+        backups: List[BackupInfo] = []
+        if not self.backup_root.exists():
+            return backups
 
+        index = self._load_index()
+        dirty = False
+        object_sums: Dict[str, Optional[str]] = {}  # objects shared by several backups are hashed once
+        object_sizes: Dict[str, int] = {}
+        names = sorted(
+            (item.name for item in self.backup_root.iterdir() if item.name.startswith("20") and item.is_dir()),
+            reverse=True,
+        )
+        for stale in set(index) - set(names):
+            del index[stale]
+            dirty = True
+
+        for name in names:
+            item = self.backup_root / name
+            entry: BackupInfo = {"timestamp": name, "path": str(item)}
+            cached = index.get(name)
+            if cached is not None and "objects_size" in cached and not verify:
+                entry.update(cached)
+            else:
+                manifest = read_manifest(item)
+                if manifest is not None:
+                    entry["action"] = manifest.get("action", "unknown")
+                    entry["created"] = manifest.get("created", "")
+                    entry["files"] = len(manifest.get("files", []))
+                summary = (manifest or {}).get("summary")
+                measured = measure_backup(item, hash_files=verify) if verify or not summary else summary
+                entry["objects_size"] = sum(self._manifest_objects(manifest or {}, object_sizes).values())
+                entry["size"] = measured["size"] + entry["objects_size"]  # type: ignore[index]
+                if verify and not summary:
+                    entry["verified"] = None  # nothing recorded to check against
+                    entry["problems"] = ["no summary recorded; backup predates checksums or was interrupted"]
+                elif verify:
+                    entry["problems"] = self._verify_problems(summary, measured)  # type: ignore[arg-type]
+                    entry["problems"] += self._verify_objects(manifest or {}, object_sums)
+                    entry["verified"] = not entry["problems"]
+                elif manifest is not None and (item / MANIFEST_NAME).exists():
+                    if not summary:
+                        manifest["summary"] = {"size": measured["size"], "files": entry["files"]}  # type: ignore[index]
+                    index[name] = self._index_entry(manifest)
+                    dirty = True
+            entry["size_human"] = format_size(int(entry.get("size", 0)))
+            backups.append(entry)
+
+        if dirty:
+            self._save_index(index)
         return backups
 
-    def restore(self, timestamp: str) -> ResultDict:
-        """Restore from a backup."""
+    def _verify_problems(self, summary: Dict[str, object], measured: Dict[str, object]) -> List[str]:
+        """Differences between a backup's recorded summary and what is on disk now."""
+        problems = []
+        if summary["size"] != measured["size"]:
+            problems.append(f"size {measured['size']} != recorded {summary['size']}")
+        recorded: Dict[str, str] = summary.get("checksums", {})  # type: ignore[assignment]
+        actual: Dict[str, str] = measured["checksums"]  # type: ignore[assignment]
+        for name, digest in recorded.items():
+            if name not in actual:
+                problems.append(f"{name}: missing")
+            elif actual[name] != digest:
+                problems.append(f"{name}: checksum mismatch")
+        for name in actual.keys() - recorded.keys():
+            problems.append(f"{name}: not in manifest summary")
+        return problems
+
+    def _verify_objects(self, manifest: Dict[str, object], object_sums: Dict[str, Optional[str]]) -> List[str]:
+        """Dedup objects a manifest references that are missing or no longer match their sha256."""
+        problems = []
+        for entry in manifest.get("files", []):  # type: ignore[attr-defined]
+            if "sha256" not in entry:
+                continue
+            name = str(entry["backup"])
+            if name not in object_sums:
+                digest = hashlib.sha256()
+                try:
+                    with gzip.open(self.backup_root / name, "rb") as f:
+                        for block in iter(lambda: f.read(GZIP_BLOCK_SIZE), b""):
+                            digest.update(block)
+                    object_sums[name] = digest.hexdigest()
+                except FileNotFoundError:
+                    object_sums[name] = None
+                except (OSError, EOFError, zlib.error):
+                    object_sums[name] = ""
+            actual = object_sums[name]
+            if actual is None:
+                problems.append(f"{name}: missing (for {entry['original']})")
+            elif actual != entry["sha256"]:
+                problems.append(f"{name}: checksum mismatch (for {entry['original']})")
+        return problems
+
+    def restore(self, timestamp: str, patterns: Optional[List[str]] = None) -> ResultDict:
+        """Restore from a backup, or with patterns only the paths matching a glob."""
         backup_dir = self.backup_root / timestamp
 
         if not backup_dir.exists():
             return {"status": "error", "message": f"Backup not found: {backup_dir}"}
 
-        manifest_path = backup_dir / "manifest.json"
-        if not manifest_path.exists():
+        manifest = read_manifest(backup_dir)
+        if manifest is None:
             return {"status": "error", "message": "No manifest found in backup"}
 
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
+        def wanted(path: str) -> bool:
+            return not patterns or any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
 
         restored = []
+        skipped: List[str] = []
+        moved_back = False
         for file_entry in manifest.get("files", []):
             original = file_entry["original"]
             backup_name = file_entry["backup"]
             backup_path = backup_dir / backup_name
 
-            if backup_name.endswith((".tgz", ".tar.gz")):
-                # Extract tarball
+            if patterns and backup_name.endswith((".tgz", ".tar.gz")):
                 parent = Path(original).parent
-                subprocess.run(
-                    ["tar", "-xzf", str(backup_path), "-C", str(parent)],
-                    check=True,
-                )
+                for name in extract_matching(backup_path, parent, lambda name: wanted(str(parent / name))):
+                    restored.append(str(parent / name))
+            elif patterns and file_entry.get("moved") and backup_path.is_dir() and not wanted(original):
+                # Pick matching files out of a moved tree
+                for dirpath, _, filenames in os.walk(backup_path):
+                    for filename in filenames:
+                        moved = Path(dirpath) / filename
+                        target = Path(original) / moved.relative_to(backup_path)
+                        if not wanted(str(target)):
+                            continue
+                        if os.path.lexists(target):
+                            skipped.append(f"{target}: already exists, left in {moved}")
+                            continue
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        os.rename(moved, target)
+                        restored.append(str(target))
+                        moved_back = True
+            elif not wanted(original):
+                continue
+            elif "sha256" in file_entry:
+                problem = self._restore_object(file_entry)
+                if problem is None:
+                    restored.append(original)
+                else:
+                    skipped.append(f"{original}: {problem}")
+            elif "symlink" in file_entry:
+                if not os.path.lexists(original):
+                    Path(original).parent.mkdir(parents=True, exist_ok=True)
+                    os.symlink(file_entry["symlink"], original)
+                restored.append(original)
+            elif file_entry.get("moved"):
+                # Moved, not copied: rename it back unless something replaced it
+                if backup_path.exists() and not os.path.lexists(original):
+                    Path(original).parent.mkdir(parents=True, exist_ok=True)
+                    os.rename(backup_path, original)
+                    restored.append(original)
+                    moved_back = True
+                elif backup_path.exists():
+                    skipped.append(f"{original}: already exists, left in {backup_path}")
+            elif backup_name.endswith((".tgz", ".tar.gz")):
+                # Extract tarball next to the original it was taken from
+                parent = Path(original).parent
+                with tarfile.open(backup_path, "r:gz") as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(parent, filter="data")
+                    else:
+                        tar.extractall(parent)
                 restored.append(original)
             elif backup_path.exists():
                 shutil.copy2(backup_path, original)
                 restored.append(original)
 
-        return {
-            "status": "success",
+        summary = manifest.get("summary")
+        if moved_back and summary and (backup_dir / MANIFEST_NAME).exists():
+            # The backup gave its data back; re-record what it holds so --verify still agrees
+            measured = measure_backup(backup_dir)
+            summary.update(size=measured["size"], checksums=measured["checksums"])  # type: ignore[union-attr]
+            self._write_manifest(backup_dir, manifest)
+            index = self._load_index()
+            index[timestamp] = self._index_entry(manifest)
+            self._save_index(index)
+
+        if patterns and not restored and not skipped:
+            return {"status": "error", "message": f"Nothing in {timestamp} matches {', '.join(patterns)}"}
+
+        result: ResultDict = {
+            "status": "partial" if skipped else "success",
             "restored": restored,
             "message": f"Restored {len(restored)} items from {timestamp}",
         }
+        if skipped:
+            result["skipped"] = skipped
+        return result
+
+    def _restore_object(self, entry: Dict[str, object]) -> Optional[str]:
+        """Write a deduplicated file back from the object store; returns why not, if it wasn't.
+
+        The object is decompressed to a temp file beside the original and
+        only renamed into place once its hash matches the manifest, so a
+        corrupt object never replaces anything. An existing file is kept.
+        """
+        original = Path(str(entry["original"]))
+        if os.path.lexists(original):
+            return "already exists, not overwritten"
+        tmp = original.with_name(f".{original.name}.{os.getpid()}.tmp")
+        digest = hashlib.sha256()
+        try:
+            original.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.backup_root / str(entry["backup"]), "rb") as src, open(tmp, "wb") as dst:
+                for block in iter(lambda: src.read(GZIP_BLOCK_SIZE), b""):
+                    digest.update(block)
+                    dst.write(block)
+            if digest.hexdigest() != entry["sha256"]:
+                return f"object {entry['backup']} is corrupt (sha256 mismatch)"
+            os.chmod(tmp, int(entry.get("mode", 0o644)))  # type: ignore[arg-type]
+            mtime = float(entry.get("mtime", time.time()))  # type: ignore[arg-type]
+            os.utime(tmp, (mtime, mtime))
+            os.replace(tmp, original)
+        except (OSError, EOFError, zlib.error, gzip.BadGzipFile) as e:
+            return f"cannot restore from {entry['backup']}: {e}"
+        finally:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+        return None
 
 
 class ActionExecutor:
     """Execute remediation actions with safety guarantees."""
 
     def __init__(
-        self, preview: bool = True, confirm: bool = False, verbose: bool = False
+        self,
+        preview: bool = True,
+        confirm: bool = False,
+        verbose: bool = False,
+        report: Optional[Dict[str, List[FileInfo]]] = None,
+        report_size: Optional[int] = None,
+        backup_mode: str = "tar",
+        backup_mgr: Optional[BackupManager] = None,
+        deleter: Optional[DeletionEngine] = None,
+        background_delete: bool = False,
+        resume: bool = False,
     ):
         self.preview = preview
         self.confirm = confirm
         self.verbose = verbose
         self.home = Path.home()
         self.claude_dir = self._resolve_claude_dir()
-        self.backup_mgr = BackupManager()
+        self.backup_mgr = backup_mgr or BackupManager()
+        self.deleter = deleter or DeletionEngine()
+        self.background_delete = background_delete
+        self.resume = resume
+        self.resumed: Optional[Checkpoint] = None  # the unfinished run --resume picked up
+        self.checkpoint: Optional[Checkpoint] = None
+        self.staging_dir: Optional[Path] = None
+        self._staged = 0
+        self.purger_pid: Optional[int] = None
         self.permission_errors: List[str] = []
+        # Candidates from a scan report; None means discover them on disk
+        self.report = report
+        self.report_size = report_size  # ~/.claude's size when the report was made
+        self.stale: List[str] = []
+        # "tar" archives, "move" renames, "dedup" stores contents in the shared object store
+        self.backup_mode = backup_mode
+        self._index = None
 
     def _resolve_claude_dir(self) -> Path:
         """Resolve ~/.claude or $CLAUDE_CONFIG_DIR."""
@@ -250,6 +1553,271 @@ class ActionExecutor:
         if self.verbose:
             print(f"[fix] {msg}", file=sys.stderr)
 
+    @property
+    def index(self):
+        """Tree index of the config dir, walked once and shared by every action.
+
+        The scanner's on-disk cache is not used: deletions must see the
+        sizes as they are now.
+        """
+        if self._index is None:
+            scanner = load_scanner()
+            self._log(f"Indexing {self.claude_dir}...")
+            self._index = scanner.TreeIndex(self.claude_dir, workers=scanner.DEFAULT_WORKERS)
+        return self._index
+
+    def _dir_info(self, node) -> FileInfo:
+        """Candidate entry for an indexed directory."""
+        return {
+            "path": node.path,
+            "size": node.size,
+            "size_human": format_size(node.size),
+            "mtime": node.mtime,
+        }
+
+    def _select(self, action: str, days: int = 30) -> List[FileInfo]:
+        """Candidates for a DELETE-* action, from the scan report or the shared index."""
+        cache_dir = self.claude_dir / "plugins" / "cache"
+        projects_dir = self.claude_dir / "projects"
+        debug_dir = self.claude_dir / "debug"
+        finders: Dict[str, Tuple[Path, Callable[[], List[FileInfo]]]] = {
+            "DELETE-cache-dirs": (self.claude_dir, self._find_cache_dirs),
+            "DELETE-debug-logs": (debug_dir, lambda: self._find_old_debug_logs(debug_dir, days)),
+            "DELETE-old-plugin-versions": (cache_dir, lambda: self._find_old_plugin_versions(cache_dir)),
+            "DELETE-plugin-cache": (cache_dir, lambda: self._find_plugin_cache(cache_dir)),
+            "DELETE-orphaned-projects": (projects_dir, lambda: self._find_orphaned_projects(projects_dir)),
+            "DELETE-old-sessions": (projects_dir, lambda: self._find_old_sessions(projects_dir, days)),
+        }
+        base_dir, find = finders[action]
+        files_info = self._candidates(action, base_dir, find)
+
+        if action in ("DELETE-debug-logs", "DELETE-old-sessions") and self.report is not None:
+            # The scan picked these with its own cutoff; --days must still hold
+            scanner = load_scanner()
+            for info in [info for info in files_info if scanner.age_days(float(info["mtime"])) <= days]:
+                self.stale.append(f"{info['path']}: not older than {days} days")
+                files_info.remove(info)
+
+        if action == "DELETE-cache-dirs":
+            # A report may only name the known cache dirs, never arbitrary config dirs
+            allowed = {str(path) for _, path in self._cache_dirs()}
+            for info in [info for info in files_info if str(info["path"]) not in allowed]:
+                self.stale.append(f"{info['path']}: not a cache directory")
+                files_info.remove(info)
+        elif action == "DELETE-orphaned-projects" and self.report is not None:
+            # The project may have been recreated since the scan; that is one stat
+            for info in [info for info in files_info if Path(self._original_path(str(info["path"]))).is_dir()]:
+                self.stale.append(f"{info['path']}: project path exists again")
+                files_info.remove(info)
+        return files_info
+
+    def _candidates(
+        self, action: str, base_dir: Path, find: Callable[[], List[FileInfo]]
+    ) -> List[FileInfo]:
+        """Candidates listed in the scan report (if any) that are unchanged, else find()."""
+        if self.report is None:
+            return find()
+        fresh, stale = restat_candidates(self.report.get(action, []), base_dir)
+        self._log(f"{action}: {len(fresh)} candidates from report, {len(stale)} stale")
+        self.stale.extend(stale)
+        return fresh
+
+    def _backup_victims(
+        self, backup_dir: Path, source: Path, files_info: List[FileInfo], name: str
+    ) -> Tuple[List[FileInfo], List[FileInfo]]:
+        """Back up paths about to be deleted; returns (still to delete, already moved away).
+
+        In move mode the rename is both the backup and the removal, and a
+        path that fails to move is reported and left alone. Across
+        filesystems move mode falls back to a tarball. Dedup mode writes
+        only content the object store does not have yet.
+        """
+        if self.backup_mode == "move":
+            if same_filesystem(backup_dir, source):
+                moved, errors = self.backup_mgr.backup_paths_move(backup_dir, source, files_info, name)
+                self.permission_errors.extend(errors)
+                return [], moved
+            self._log(f"{backup_dir} is on another filesystem than {source}; archiving instead")
+        elif self.backup_mode == "dedup":
+            stored, reused = self.backup_mgr.backup_paths_dedup(backup_dir, [str(info["path"]) for info in files_info])
+            self._log(f"Object store: {format_size(stored)} new, {format_size(reused)} already stored")
+            return files_info, []
+        self.backup_mgr.backup_paths_tar(
+            backup_dir, source, [str(info["path"]) for info in files_info], f"{name}.tgz"
+        )
+        return files_info, []
+
+    def _planned(self, action: str, days: int = 30) -> List[FileInfo]:
+        """Candidates for an action; with --resume, what its last unfinished run left."""
+        if self.resume:
+            self.resumed = Checkpoint.find(self.backup_mgr.backup_root, action)
+            if self.resumed is not None:
+                self._log(f"Resuming {action} from {self.resumed.backup_dir}")
+                return self.resumed.remaining()
+        return self._select(action, days)
+
+    def _begin(self, action: str, description: str, files_info: List[FileInfo]) -> Tuple[Path, bool]:
+        """Open the backup dir and checkpoint for a run; returns (backup dir, already backed up).
+
+        A resumed run whose backup was committed carries on in the same
+        backup dir. One interrupted during the backup starts a new one
+        for what is left.
+        """
+        resumed = self.resumed
+        if resumed is not None and resumed.backed_up:
+            self.checkpoint = resumed
+            return resumed.backup_dir, True
+        if resumed is not None:
+            resumed.finish()
+        backup_dir = self.backup_mgr.create_backup_dir()
+        self.backup_mgr.create_manifest(backup_dir, action, description)
+        self.checkpoint = Checkpoint.start(backup_dir, action, files_info)
+        return backup_dir, False
+
+    def _commit_backup(self, backup_dir: Path) -> None:
+        """Compact the manifest and record in the checkpoint that the backup is complete."""
+        self.backup_mgr.commit_manifest(backup_dir)
+        if self.checkpoint is not None:
+            self.checkpoint.mark_backed_up()
+
+    def _remove(self, paths: List[Path]) -> List[Path]:
+        """Delete paths with the deletion engine; returns the ones fully removed.
+
+        Errors for the rest go to permission_errors. With background_delete,
+        paths are renamed into the trash instead and a detached purge-trash
+        deletes them; only paths that cannot be renamed are deleted here.
+        """
+        removed: List[Path] = []
+        failed = False
+        for start in range(0, len(paths), CHECKPOINT_BATCH):
+            batch = paths[start:start + CHECKPOINT_BATCH]
+            unmoved = self._stage(batch) if self.background_delete else batch
+            failures = self.deleter.remove(unmoved)
+            for errors in failures.values():
+                self.permission_errors.extend(errors)
+            done = [path for path in batch if path not in failures]
+            if self.checkpoint is not None:
+                self.checkpoint.mark_deleted(done)
+            removed.extend(done)
+            failed = failed or bool(failures)
+        if self.staging_dir is not None:
+            # Only now is the staging dir complete, so a purger cannot finish early
+            (self.staging_dir / STAGING_MARKER).unlink(missing_ok=True)
+            if self._staged and self.purger_pid is None:
+                self.purger_pid = self._spawn_purger()
+        if self.checkpoint is not None and not failed:
+            self.checkpoint.finish()  # otherwise --resume retries what failed
+        return removed
+
+    @property
+    def trash_dir(self) -> Path:
+        return self.claude_dir / TRASH_DIR_NAME
+
+    def _stage(self, paths: List[Path]) -> List[Path]:
+        """Rename paths into this run's trash dir; returns the ones that could not be moved."""
+        if self.staging_dir is None:
+            stamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+            self.staging_dir = self.trash_dir / f"{stamp}-{os.getpid()}"
+            self.staging_dir.mkdir(parents=True, exist_ok=True)
+        (self.staging_dir / STAGING_MARKER).write_text(str(os.getpid()))
+        unmoved = []
+        for path in paths:
+            target = self.staging_dir / f"{self._staged:06d}-{path.name}"
+            try:
+                os.rename(path, target)
+                self._staged += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:  # e.g. a mount point; delete it in place
+                self._log(f"Cannot stage {path} ({e}); deleting it now")
+                unmoved.append(path)
+        return unmoved
+
+    def _still_staging(self, staged: Path) -> bool:
+        """True if a live run is still renaming into this staging dir."""
+        try:
+            pid = int((staged / STAGING_MARKER).read_text())
+        except (OSError, ValueError):
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False  # that run died mid-staging; its dir is complete as it is
+        except PermissionError:
+            pass
+        return True
+
+    def _spawn_purger(self) -> int:
+        """Start purge-trash in its own session so it outlives this process."""
+        command = [sys.executable, os.path.abspath(__file__), "purge-trash", "--confirm", "--json"]
+        if self.deleter.throttle is not None and self.backup_mgr.throttle is not None:
+            command += [
+                "--throttle", str(int(self.backup_mgr.throttle.rate)),
+                "--throttle-unlinks", str(self.deleter.throttle.rate),
+            ]
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self._log(f"Purging {self.staging_dir} in the background (pid {proc.pid})")
+        return proc.pid
+
+    def purge_trash(self) -> ResultDict:
+        """purge-trash: Delete everything staged in ~/.claude/.trash by --background-delete."""
+        if not self.trash_dir.exists():
+            return {"status": "skip", "reason": "Nothing staged for deletion"}
+
+        staged = [path for path in sorted(self.trash_dir.iterdir()) if not self._still_staging(path)]
+        if not staged:
+            return {"status": "skip", "reason": "Nothing staged for deletion"}
+        scanner = load_scanner()
+        trash = scanner.TreeIndex(self.trash_dir, workers=scanner.DEFAULT_WORKERS)
+        files_info = []
+        for path in staged:
+            node = trash.node(path)
+            size = node.size if node is not None else 0
+            files_info.append({"path": str(path), "size": size, "size_human": format_size(size)})
+        total_size = sum(int(info["size"]) for info in files_info)
+
+        if self.preview or not self.confirm:
+            return {
+                "status": "preview",
+                "action": "purge-trash",
+                "files": files_info,
+                "total_size": total_size,
+                "total_size_human": format_size(total_size),
+                "backup_location": "none (backed up when it was staged)",
+            }
+
+        # Deleted outright: the staged data was backed up when it was staged
+        failures = self.deleter.remove(staged)
+        for errors in failures.values():
+            self.permission_errors.extend(errors)
+        try:
+            self.trash_dir.rmdir()
+        except OSError:
+            pass  # another run is still staging, or staged something meanwhile
+
+        purged = len(staged) - len(failures)
+        if self.permission_errors:
+            return {
+                "status": "partial",
+                "deleted": purged,
+                "failed": len(self.permission_errors),
+                "errors": self.permission_errors,
+                "message": f"Purged {purged}/{len(staged)} staging dirs.",
+            }
+        return {
+            "status": "success",
+            "size_freed": total_size,
+            "size_freed_human": format_size(total_size),
+            "dirs_removed": purged,
+            "message": f"Purged {purged} staging dirs ({format_size(total_size)})",
+        }
+
     def _check_permission(self, path: Path, operation: str = "access") -> None:
         """Check permission and fail fast if not accessible."""
         try:
@@ -291,6 +1859,7 @@ class ActionExecutor:
             backup_dir, "DELETE-auth-config", "Backup of auth config before disable"
         )
         self.backup_mgr.backup_file(backup_dir, claude_json, "claude.json")
+        self.backup_mgr.commit_manifest(backup_dir)
 
         disabled_path = claude_json.parent / f".claude.json.disabled.{datetime.now().strftime('%Y%m%d%H%M%S')}"
         shutil.move(str(claude_json), str(disabled_path))
@@ -305,6 +1874,107 @@ class ActionExecutor:
             "restore_cmd": f"python3 {__file__} restore-backup --timestamp {backup_dir.name}",
         }
 
+    def slim_claude_json(self, keep: int) -> ResultDict:
+        """SLIM-claude-json: Keep only the newest N history entries per project.
+
+        Rewrites ~/.claude.json by copying byte ranges around the dropped
+        entries, so the file is never parsed into memory. Auth and
+        preferences are untouched, so no re-login is needed.
+        """
+        claude_json = self.home / ".claude.json"
+
+        if not claude_json.exists():
+            return {"status": "skip", "reason": "File not found: ~/.claude.json"}
+
+        self._check_permission(claude_json, "read")
+        scanner = load_scanner()
+        before = claude_json.stat()
+        profile = scanner.profile_claude_json(claude_json, record_history=True)
+
+        # Claude Code prepends to history, so the newest entries come first.
+        # Byte ranges to drop: from the comma after the last kept entry (or
+        # after "[" when nothing is kept) up to "]".
+        cuts: List[Tuple[int, int]] = []
+        files_info: List[Dict[str, Union[str, int]]] = []
+        for project, (start, end, commas) in profile.history_spans.items():
+            entries = profile.projects[project].entries
+            if entries <= keep:
+                continue
+            cut_start = start + 1 if keep == 0 else commas[keep - 1]
+            cuts.append((cut_start, end))
+            files_info.append({
+                "path": project,
+                "entries": entries,
+                "dropped": entries - keep,
+                "size": end - cut_start,
+                "size_human": format_size(end - cut_start),
+            })
+        cuts.sort()
+        files_info.sort(key=lambda info: int(info["size"]), reverse=True)
+        total_size = sum(end - start for start, end in cuts)
+
+        if not cuts:
+            return {"status": "skip", "reason": f"No project has more than {keep} history entries"}
+
+        if self.preview or not self.confirm:
+            return {
+                "status": "preview",
+                "action": "SLIM-claude-json",
+                "files": files_info,
+                "total_size": total_size,
+                "total_size_human": format_size(total_size),
+                "keep": keep,
+                "warning": "Quit running Claude Code sessions first; they rewrite ~/.claude.json",
+                "backup_location": str(BACKUP_ROOT / "<timestamp>"),
+            }
+
+        # Execute
+        backup_dir = self.backup_mgr.create_backup_dir()
+        self.backup_mgr.create_manifest(
+            backup_dir, "SLIM-claude-json", f"Kept newest {keep} history entries per project"
+        )
+        self.backup_mgr.backup_file(backup_dir, claude_json, "claude.json")
+        self.backup_mgr.commit_manifest(backup_dir)
+
+        tmp_path = claude_json.with_name(f".claude.json.slim.{os.getpid()}")
+        try:
+            with open(claude_json, "rb") as src, open(tmp_path, "wb") as dst:
+                pos = 0
+                for cut_start, cut_end in cuts:
+                    copy_range(src, dst, pos, cut_start)
+                    pos = cut_end
+                copy_range(src, dst, pos, before.st_size)
+                dst.flush()
+                os.fsync(dst.fileno())
+            shutil.copymode(claude_json, tmp_path)
+
+            # Sanity check the rewrite before it replaces the original
+            slimmed = scanner.profile_claude_json(tmp_path)
+            if set(slimmed.keys) != set(profile.keys) or set(slimmed.projects) != set(profile.projects):
+                raise ValueError("rewritten file does not match the original structure")
+
+            after = claude_json.stat()
+            if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+                raise ValueError("~/.claude.json changed while slimming; quit Claude Code and retry")
+            os.replace(tmp_path, claude_json)
+        except (OSError, ValueError) as e:
+            tmp_path.unlink(missing_ok=True)
+            return {
+                "status": "error",
+                "message": f"Could not slim ~/.claude.json: {e}",
+                "backup": str(backup_dir),
+            }
+
+        return {
+            "status": "success",
+            "size_freed": total_size,
+            "size_freed_human": format_size(total_size),
+            "projects_trimmed": len(files_info),
+            "backup": str(backup_dir),
+            "message": f"Trimmed history of {len(files_info)} projects to {keep} entries ({format_size(total_size)})",
+            "restore_cmd": f"python3 {__file__} restore-backup --timestamp {backup_dir.name}",
+        }
+
     def delete_plugin_cache(self) -> ResultDict:
         """DELETE-plugin-cache: Remove plugin cache directories."""
         cache_dir = self.claude_dir / "plugins" / "cache"
@@ -314,21 +1984,11 @@ class ActionExecutor:
 
         self._check_permission(cache_dir, "read")
 
-        # Collect file list
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
-
-        for marketplace in cache_dir.iterdir():
-            if marketplace.is_dir():
-                for plugin in marketplace.iterdir():
-                    if plugin.is_dir():
-                        size = get_dir_size(plugin)
-                        total_size += size
-                        files_info.append({
-                            "path": str(plugin),
-                            "size": size,
-                            "size_human": format_size(size),
-                        })
+        files_info = self._planned("DELETE-plugin-cache")
+        total_size = sum(int(info["size"]) for info in files_info)
+
+        if not files_info and self.report is not None:
+            return {"status": "skip", "reason": "No unchanged plugin cache entries in the scan report"}
 
         if self.preview or not self.confirm:
             return {
@@ -342,27 +2002,25 @@ class ActionExecutor:
             }
 
         # Execute - backup manifest only (cache can be redownloaded)
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir, "DELETE-plugin-cache", f"Cleared {format_size(total_size)} plugin cache"
+        backup_dir, backed_up = self._begin(
+            "DELETE-plugin-cache", f"Cleared {format_size(total_size)} plugin cache", files_info
         )
-
-        # Save list of what was deleted for reference
-        with open(backup_dir / "deleted-plugins.json", "w") as f:
-            json.dump(files_info, f, indent=2)
-
-        try:
-            shutil.rmtree(cache_dir)
-        except PermissionError as e:
+        if not backed_up:
+            # Save list of what was deleted for reference
+            with open(backup_dir / "deleted-plugins.json", "w") as f:
+                json.dump(files_info, f, indent=2)
+            self._commit_backup(backup_dir)
+
+        # A report (or a checkpoint) only vouches for the plugin dirs it lists
+        partial = self.report is not None or self.resumed is not None
+        targets = [Path(str(info["path"])) for info in files_info] if partial else [cache_dir]
+        self._remove(targets)
+        if self.permission_errors:
             return {
                 "status": "partial",
-                "error": f"Could not fully remove cache: {e}",
-                "backup": str(backup_dir),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to remove cache: {e}",
+                "error": f"Could not fully remove cache: {self.permission_errors[0]}",
+                "failed": len(self.permission_errors),
+                "errors": self.permission_errors,
                 "backup": str(backup_dir),
             }
 
@@ -375,6 +2033,14 @@ class ActionExecutor:
             "message": f"Cleared {format_size(total_size)} from plugin cache ({len(files_info)} plugins)",
         }
 
+    def _find_plugin_cache(self, cache_dir: Path) -> List[FileInfo]:
+        """Every plugin directory in the cache."""
+        return [
+            self._dir_info(plugin)
+            for marketplace in self.index.subdirs(cache_dir)
+            for plugin in marketplace.dirs.values()
+        ]
+
     def delete_old_sessions(self, days: int) -> ResultDict:
         """DELETE-old-sessions: Delete session files older than N days."""
         projects_dir = self.claude_dir / "projects"
@@ -384,21 +2050,8 @@ class ActionExecutor:
 
         self._check_permission(projects_dir, "read")
 
-        # Find old files
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
-
-        for session_file in projects_dir.rglob("*.jsonl"):
-            age = get_file_age_days(session_file)
-            if age > days:
-                size = session_file.stat().st_size
-                total_size += size
-                files_info.append({
-                    "path": str(session_file),
-                    "size": size,
-                    "size_human": format_size(size),
-                    "age_days": age,
-                })
+        files_info = self._planned("DELETE-old-sessions", days)
+        total_size = sum(int(info["size"]) for info in files_info)
 
         if not files_info:
             return {"status": "skip", "reason": f"No session files older than {days} days"}
@@ -416,31 +2069,29 @@ class ActionExecutor:
             }
 
         # Execute with backup
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir,
-            "DELETE-old-sessions",
-            f"Sessions older than {days} days ({len(files_info)} files)",
+        backup_dir, backed_up = self._begin(
+            "DELETE-old-sessions", f"Sessions older than {days} days ({len(files_info)} files)", files_info
         )
 
-        # Backup projects directory as tarball
-        self.backup_mgr.backup_dir_tar(backup_dir, projects_dir, "projects.tgz")
+        # Backup only the session files being deleted
+        to_delete, moved = files_info, []
+        if not backed_up:
+            to_delete, moved = self._backup_victims(backup_dir, projects_dir, files_info, "projects")
+            self._commit_backup(backup_dir)
 
         # Delete old files (with path validation for security)
-        deleted = 0
         base_dir = projects_dir.resolve()
-        for file_info in files_info:
+        targets = []
+        for file_info in to_delete:
             path = Path(str(file_info["path"])).resolve()
             try:
                 # Validate path is within expected directory (prevent traversal)
                 path.relative_to(base_dir)
-                path.unlink()
-                deleted += 1
+                targets.append(path)
             except ValueError:
                 # Path is outside base_dir - skip for security
                 self.permission_errors.append(f"{path}: outside allowed directory")
-            except PermissionError as e:
-                self.permission_errors.append(f"{path}: {e}")
+        deleted = len(moved) + len(self._remove(targets))
 
         if self.permission_errors:
             return {
@@ -462,6 +2113,10 @@ class ActionExecutor:
             "restore_cmd": f"python3 {__file__} restore-backup --timestamp {backup_dir.name}",
         }
 
+    def _find_old_sessions(self, projects_dir: Path, days: int) -> List[FileInfo]:
+        """Session files older than N days."""
+        return self._old_files(projects_dir, days, ".jsonl")
+
     def delete_debug_logs(self, days: int = 14) -> ResultDict:
         """DELETE-debug-logs: Delete debug log files older than N days."""
         debug_dir = self.claude_dir / "debug"
@@ -471,22 +2126,8 @@ class ActionExecutor:
 
         self._check_permission(debug_dir, "read")
 
-        # Find old files
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
-
-        for log_file in debug_dir.rglob("*"):
-            if log_file.is_file():
-                age = get_file_age_days(log_file)
-                if age > days:
-                    size = log_file.stat().st_size
-                    total_size += size
-                    files_info.append({
-                        "path": str(log_file),
-                        "size": size,
-                        "size_human": format_size(size),
-                        "age_days": age,
-                    })
+        files_info = self._planned("DELETE-debug-logs", days)
+        total_size = sum(int(info["size"]) for info in files_info)
 
         if not files_info:
             return {"status": "skip", "reason": f"No debug files older than {days} days"}
@@ -504,25 +2145,16 @@ class ActionExecutor:
             }
 
         # Execute - debug logs typically don't need backup
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir,
-            "DELETE-debug-logs",
-            f"Debug logs older than {days} days ({len(files_info)} files)",
+        backup_dir, backed_up = self._begin(
+            "DELETE-debug-logs", f"Debug logs older than {days} days ({len(files_info)} files)", files_info
         )
+        if not backed_up:
+            # Save list of deleted files
+            with open(backup_dir / "deleted-logs.json", "w") as f:
+                json.dump(files_info, f, indent=2)
+            self._commit_backup(backup_dir)
 
-        # Save list of deleted files
-        with open(backup_dir / "deleted-logs.json", "w") as f:
-            json.dump(files_info, f, indent=2)
-
-        deleted = 0
-        for file_info in files_info:
-            path = Path(str(file_info["path"]))
-            try:
-                path.unlink()
-                deleted += 1
-            except PermissionError as e:
-                self.permission_errors.append(f"{path}: {e}")
+        deleted = len(self._remove([Path(str(file_info["path"])) for file_info in files_info]))
 
         if self.permission_errors:
             return {
@@ -541,6 +2173,26 @@ class ActionExecutor:
             "message": f"Deleted {deleted} debug files ({format_size(total_size)})",
         }
 
+    def _find_old_debug_logs(self, debug_dir: Path, days: int) -> List[FileInfo]:
+        """Debug log files older than N days."""
+        return self._old_files(debug_dir, days)
+
+    def _old_files(self, directory: Path, days: int, suffix: str = "") -> List[FileInfo]:
+        """Indexed files below a directory older than N days."""
+        scanner = load_scanner()
+        files_info: List[FileInfo] = []
+        for path, size, mtime in self.index.iter_files(directory, suffix):
+            age = scanner.age_days(mtime)
+            if age > days:
+                files_info.append({
+                    "path": path,
+                    "size": size,
+                    "size_human": format_size(size),
+                    "age_days": age,
+                    "mtime": mtime,
+                })
+        return files_info
+
     def disable_nonessential_traffic(self) -> ResultDict:
         """Set CLAUDE_CODE_DISABLE_NONESSENTIAL_TRAFFIC=1 in settings."""
         settings_path = self.claude_dir / "settings.json"
@@ -569,6 +2221,7 @@ class ActionExecutor:
         self.backup_mgr.create_manifest(backup_dir, "disable-nonessential", "Settings change")
         if settings_path.exists():
             self.backup_mgr.backup_file(backup_dir, settings_path)
+        self.backup_mgr.commit_manifest(backup_dir)
 
         settings_path.parent.mkdir(parents=True, exist_ok=True)
         with open(settings_path, "w") as f:
@@ -604,6 +2257,7 @@ class ActionExecutor:
         self.backup_mgr.create_manifest(backup_dir, "set-cleanup-period", f"Set to {days} days")
         if settings_path.exists():
             self.backup_mgr.backup_file(backup_dir, settings_path)
+        self.backup_mgr.commit_manifest(backup_dir)
 
         settings_path.parent.mkdir(parents=True, exist_ok=True)
         with open(settings_path, "w") as f:
@@ -617,9 +2271,9 @@ class ActionExecutor:
             "message": f"Set cleanupPeriodDays={days}. Old sessions deleted at startup.",
         }
 
-    def delete_cache_dirs(self) -> ResultDict:
-        """DELETE-cache-dirs: Clear cache directories."""
-        cache_dirs = [
+    def _cache_dirs(self) -> List[Tuple[str, Path]]:
+        """Directories DELETE-cache-dirs may clear."""
+        return [
             ("debug", self.claude_dir / "debug"),
             ("shell-snapshots", self.claude_dir / "shell-snapshots"),
             ("paste-cache", self.claude_dir / "paste-cache"),
@@ -627,20 +2281,19 @@ class ActionExecutor:
             ("session-env", self.claude_dir / "session-env"),
         ]
 
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
+    def _find_cache_dirs(self) -> List[FileInfo]:
+        """Cache directories with content."""
+        files_info: List[FileInfo] = []
+        for name, path in self._cache_dirs():
+            node = self.index.node(path)
+            if node and node.size > 0:
+                files_info.append({"name": name, **self._dir_info(node)})
+        return files_info
 
-        for name, path in cache_dirs:
-            if path.exists() and path.is_dir():
-                size = get_dir_size(path)
-                if size > 0:
-                    files_info.append({
-                        "path": str(path),
-                        "name": name,
-                        "size": size,
-                        "size_human": format_size(size),
-                    })
-                    total_size += size
+    def delete_cache_dirs(self) -> ResultDict:
+        """DELETE-cache-dirs: Clear cache directories."""
+        files_info = self._planned("DELETE-cache-dirs")
+        total_size = sum(int(info["size"]) for info in files_info)
 
         if not files_info:
             return {"status": "skip", "reason": "No cache directories with content found"}
@@ -656,23 +2309,19 @@ class ActionExecutor:
             }
 
         # Execute
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir, "DELETE-cache-dirs", f"Cleared {len(files_info)} cache dirs"
-        )
-
-        # Save list of what was deleted
-        with open(backup_dir / "deleted-cache-dirs.json", "w") as f:
-            json.dump(files_info, f, indent=2)
+        backup_dir, backed_up = self._begin("DELETE-cache-dirs", f"Cleared {len(files_info)} cache dirs", files_info)
+        if not backed_up:
+            # Save list of what was deleted
+            with open(backup_dir / "deleted-cache-dirs.json", "w") as f:
+                json.dump(files_info, f, indent=2)
+            self._commit_backup(backup_dir)
 
         deleted = 0
-        for info in files_info:
-            path = Path(str(info["path"]))
+        for path in self._remove([Path(str(info["path"])) for info in files_info]):
             try:
-                shutil.rmtree(path)
                 path.mkdir(parents=True, exist_ok=True)  # Recreate empty
                 deleted += 1
-            except (PermissionError, OSError) as e:
+            except OSError as e:
                 self.permission_errors.append(f"{path}: {e}")
 
         if self.permission_errors:
@@ -703,26 +2352,8 @@ class ActionExecutor:
 
         self._check_permission(projects_dir, "read")
 
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
-
-        try:
-            for project_dir in projects_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                # Convert -Users-chris-repos-foo → /Users/chris/repos/foo
-                original_path = "/" + project_dir.name.lstrip("-").replace("-", "/")
-                if not Path(original_path).is_dir():
-                    size = get_dir_size(project_dir)
-                    files_info.append({
-                        "path": str(project_dir),
-                        "original_path": original_path,
-                        "size": size,
-                        "size_human": format_size(size),
-                    })
-                    total_size += size
-        except (PermissionError, OSError):
-            pass
+        files_info = self._planned("DELETE-orphaned-projects")
+        total_size = sum(int(info["size"]) for info in files_info)
 
         if not files_info:
             return {"status": "skip", "reason": "No orphaned projects found"}
@@ -739,31 +2370,20 @@ class ActionExecutor:
             }
 
         # Execute with backup
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir,
+        backup_dir, backed_up = self._begin(
             "DELETE-orphaned-projects",
             f"{len(files_info)} orphaned project dirs ({format_size(total_size)})",
+            files_info,
         )
 
-        # Backup orphaned projects as tarball
-        orphaned_tar = backup_dir / "orphaned-projects.tgz"
-        orphaned_paths = [info["path"] for info in files_info]
-        subprocess.run(
-            ["tar", "-czf", str(orphaned_tar), "-C", str(projects_dir)] +
-            [Path(p).name for p in orphaned_paths],
-            check=True,
-        )
+        # Backup orphaned projects as tarball (or move them aside)
+        to_delete, moved = files_info, []
+        if not backed_up:
+            to_delete, moved = self._backup_victims(backup_dir, projects_dir, files_info, "orphaned-projects")
+            self._commit_backup(backup_dir)
 
         # Delete orphaned directories
-        deleted = 0
-        for info in files_info:
-            path = Path(str(info["path"]))
-            try:
-                shutil.rmtree(path)
-                deleted += 1
-            except (PermissionError, OSError) as e:
-                self.permission_errors.append(f"{path}: {e}")
+        deleted = len(moved) + len(self._remove([Path(str(info["path"])) for info in to_delete]))
 
         if self.permission_errors:
             return {
@@ -785,6 +2405,19 @@ class ActionExecutor:
             "restore_cmd": f"python3 {__file__} restore-backup --timestamp {backup_dir.name}",
         }
 
+    def _original_path(self, project_dir: str) -> str:
+        """Convert -Users-chris-repos-foo → /Users/chris/repos/foo."""
+        return "/" + os.path.basename(project_dir).lstrip("-").replace("-", "/")
+
+    def _find_orphaned_projects(self, projects_dir: Path) -> List[FileInfo]:
+        """Project directories whose original path no longer exists."""
+        files_info: List[FileInfo] = []
+        for project in self.index.subdirs(projects_dir):
+            original_path = self._original_path(project.path)
+            if not Path(original_path).is_dir():
+                files_info.append({"original_path": original_path, **self._dir_info(project)})
+        return files_info
+
     def _semver_key(self, version: str) -> Tuple[int, int, int]:
         """Convert version string to sortable tuple."""
         parts = version.lstrip("v").split(".")
@@ -806,35 +2439,8 @@ class ActionExecutor:
 
         self._check_permission(cache_dir, "read")
 
-        files_info: List[Dict[str, Union[str, int]]] = []
-        total_size = 0
-
-        try:
-            for marketplace in cache_dir.iterdir():
-                if not marketplace.is_dir():
-                    continue
-                for plugin in marketplace.iterdir():
-                    if not plugin.is_dir():
-                        continue
-                    versions = [v for v in plugin.iterdir() if v.is_dir()]
-                    if len(versions) <= 1:
-                        continue
-                    # Sort by semver, keep latest
-                    versions.sort(key=lambda v: self._semver_key(v.name), reverse=True)
-                    latest = versions[0].name
-                    for old_ver in versions[1:]:
-                        size = get_dir_size(old_ver)
-                        files_info.append({
-                            "path": str(old_ver),
-                            "plugin": plugin.name,
-                            "version": old_ver.name,
-                            "latest": latest,
-                            "size": size,
-                            "size_human": format_size(size),
-                        })
-                        total_size += size
-        except (PermissionError, OSError):
-            pass
+        files_info = self._planned("DELETE-old-plugin-versions")
+        total_size = sum(int(info["size"]) for info in files_info)
 
         if not files_info:
             return {"status": "skip", "reason": "No old plugin versions found"}
@@ -851,25 +2457,18 @@ class ActionExecutor:
             }
 
         # Execute
-        backup_dir = self.backup_mgr.create_backup_dir()
-        self.backup_mgr.create_manifest(
-            backup_dir,
+        backup_dir, backed_up = self._begin(
             "DELETE-old-plugin-versions",
             f"{len(files_info)} old plugin versions ({format_size(total_size)})",
+            files_info,
         )
+        if not backed_up:
+            # Save list of what was deleted
+            with open(backup_dir / "deleted-plugin-versions.json", "w") as f:
+                json.dump(files_info, f, indent=2)
+            self._commit_backup(backup_dir)
 
-        # Save list of what was deleted
-        with open(backup_dir / "deleted-plugin-versions.json", "w") as f:
-            json.dump(files_info, f, indent=2)
-
-        deleted = 0
-        for info in files_info:
-            path = Path(str(info["path"]))
-            try:
-                shutil.rmtree(path)
-                deleted += 1
-            except (PermissionError, OSError) as e:
-                self.permission_errors.append(f"{path}: {e}")
+        deleted = len(self._remove([Path(str(info["path"])) for info in files_info]))
 
         if self.permission_errors:
             return {
@@ -890,6 +2489,236 @@ class ActionExecutor:
             "message": f"Deleted {deleted} old plugin versions ({format_size(total_size)})",
         }
 
+    def _find_old_plugin_versions(self, cache_dir: Path) -> List[FileInfo]:
+        """Every plugin version directory except the latest."""
+        files_info: List[FileInfo] = []
+        for marketplace in self.index.subdirs(cache_dir):
+            for plugin_name, plugin in marketplace.dirs.items():
+                versions = list(plugin.dirs.items())
+                if len(versions) <= 1:
+                    continue
+                # Sort by semver, keep latest
+                versions.sort(key=lambda v: self._semver_key(v[0]), reverse=True)
+                latest = versions[0][0]
+                for version, old_ver in versions[1:]:
+                    files_info.append({
+                        "plugin": plugin_name,
+                        "version": version,
+                        "latest": latest,
+                        **self._dir_info(old_ver),
+                    })
+        return files_info
+
+    def _resume_steps(self, label: str, actions: List[str]) -> Optional[Dict[str, List[FileInfo]]]:
+        """With --resume, what the last unfinished plan/free run left, grouped by action."""
+        resumed = Checkpoint.find(self.backup_mgr.backup_root, label) if self.resume else None
+        if resumed is None or not {str(info["action"]) for info in resumed.planned} <= set(actions):
+            return None
+        self.resumed = resumed
+        self._log(f"Resuming {label} from {resumed.backup_dir}")
+        steps: Dict[str, List[FileInfo]] = {action: [] for action in actions}
+        for info in resumed.remaining():
+            steps[str(info["action"])].append({k: v for k, v in info.items() if k != "action"})
+        return steps
+
+    def plan(self, actions: List[str], days: int) -> ResultDict:
+        """plan: Run several DELETE-* actions as one batch.
+
+        Candidates for every action come from one walk (or the scan
+        report), everything is backed up into a single backup dir and
+        manifest, and only then are all paths deleted in one pass.
+        """
+        dropped: List[str] = []
+        steps = self._resume_steps("plan", actions)
+        if steps is None:
+            steps = {action: self._select(action, days) for action in actions}
+            dropped = drop_nested(steps)
+        return self._run_plan("plan", steps, dropped)
+
+    def _choose(self, target: int, days: int) -> Tuple[Dict[str, List[FileInfo]], Dict[str, object]]:
+        """Pick the cheapest candidates that bring ~/.claude under target bytes.
+
+        Candidates are ranked by safety level first (SAFETY_COST), so no
+        DESTRUCTIVE path is taken while a SAFE one is left. Within a level,
+        recent files rank later: 1 + RECENCY_COST / (1 + age in days), so a
+        week-old session comes after a year-old one. The reported cost per
+        byte is the product of the two. Candidates are taken greedily in rank order
+        (larger first on ties), skipping paths inside one already taken;
+        then picks the target turns out not to need are dropped, worst
+        ranked first. With a scan report, the current size of ~/.claude is
+        the report's. Returns (steps, summary of the budget).
+        """
+        scanner = load_scanner()
+        if self.report is not None and self.report_size is not None:
+            current = self.report_size  # so a report-driven run never walks ~/.claude
+        else:
+            current = self.index.size(self.claude_dir)
+        need = current - target
+        summary: Dict[str, object] = {
+            "target": target,
+            "target_human": format_size(target),
+            "current_size": current,
+            "current_size_human": format_size(current),
+            "need": max(need, 0),
+            "need_human": format_size(max(need, 0)),
+        }
+        if need <= 0:
+            return {}, summary
+
+        candidates: List[Tuple[Tuple[float, float], int, str, FileInfo]] = []
+        for action in FREE_ACTIONS:
+            weight = SAFETY_COST[scanner.ACTION_SAFETY[action]]
+            for info in self._select(action, days):
+                age = info.get("age_days")
+                if age is None:
+                    age = scanner.age_days(float(info["mtime"])) if "mtime" in info else 0
+                recency = 1 + RECENCY_COST / (1 + max(int(age), 0))
+                candidates.append(((weight, recency), -int(info["size"]), action, info))
+        candidates.sort(key=lambda c: (c[0], c[1]))
+
+        chosen: Dict[str, Tuple[str, FileInfo, Tuple[float, float]]] = {}
+        freed = 0
+        for rank, _, action, info in candidates:
+            if freed >= need:
+                break
+            path = str(info["path"])
+            if path in chosen or any(str(parent) in chosen for parent in Path(path).parents):
+                continue
+            # Sessions and debug logs are files; only directories can cover earlier picks
+            nested = [] if action in FILE_ACTIONS else [p for p in chosen if p.startswith(path + os.sep)]
+            gain = int(info["size"]) - sum(int(chosen[p][1]["size"]) for p in nested)
+            if gain <= 0:
+                continue
+            for p in nested:
+                del chosen[p]
+            chosen[path] = (action, info, rank)
+            freed += gain
+
+        for path in sorted(chosen, key=lambda p: chosen[p][2], reverse=True):
+            size = int(chosen[path][1]["size"])
+            if freed - size >= need:
+                del chosen[path]
+                freed -= size
+
+        steps: Dict[str, List[FileInfo]] = {}
+        for action, info, (weight, recency) in chosen.values():
+            steps.setdefault(action, []).append({**info, "cost": round(weight * recency, 2)})
+        summary["projected_size"] = current - freed
+        summary["projected_size_human"] = format_size(current - freed)
+        if freed < need:
+            summary["shortfall"] = need - freed
+            summary["shortfall_human"] = format_size(need - freed)
+        return steps, summary
+
+    def free(self, target: int, days: int) -> ResultDict:
+        """free: Delete just enough to bring ~/.claude under a target size.
+
+        Chooses the cheapest candidates across the DELETE-* actions (see
+        _choose) and runs them as one plan: one backup, one delete pass.
+        """
+        summary: Dict[str, object] = {}
+        steps = self._resume_steps("free", FREE_ACTIONS)
+        if steps is not None:
+            steps = {action: infos for action, infos in steps.items() if infos}
+        else:
+            steps, summary = self._choose(target, days)
+            if not summary["need"]:
+                return {
+                    "status": "skip",
+                    "reason": f"{self.claude_dir} is {summary['current_size_human']}, "
+                              f"already under {summary['target_human']}",
+                }
+        return self._run_plan("free", steps, [], summary)
+
+    def _run_plan(
+        self,
+        label: str,
+        steps: Dict[str, List[FileInfo]],
+        dropped: List[str],
+        summary: Optional[Dict[str, object]] = None,
+    ) -> ResultDict:
+        """Preview or run a batch of per-action candidates with one backup and one delete pass."""
+        summary = summary or {}
+        files_info = [{"action": action, **info} for action, infos in steps.items() for info in infos]
+        total_size = sum(int(info["size"]) for info in files_info)
+        if not files_info:
+            return {"status": "skip", "reason": f"Nothing to clean for {', '.join(steps) or label}", **summary}
+
+        per_action: Dict[str, Dict[str, Union[str, int]]] = {
+            action: {
+                "files": len(infos),
+                "total_size": sum(int(info["size"]) for info in infos),
+                "total_size_human": format_size(sum(int(info["size"]) for info in infos)),
+            }
+            for action, infos in steps.items()
+        }
+
+        if self.preview or not self.confirm:
+            return {
+                "status": "preview",
+                "action": label,
+                **summary,
+                "actions": per_action,
+                "files": files_info,
+                "total_size": total_size,
+                "total_size_human": format_size(total_size),
+                "overlapping": dropped,
+                "backup_location": str(BACKUP_ROOT / "<timestamp>"),
+            }
+
+        # Back up everything first, into one dir with one manifest
+        backup_dir, backed_up = self._begin(label, f"{', '.join(steps)} ({format_size(total_size)})", files_info)
+        moved: Dict[str, List[FileInfo]] = {action: [] for action in steps}
+        for action, infos in steps.items():
+            if not infos or backed_up:
+                continue
+            name = action.lower().replace("delete-", "")
+            if action in ("DELETE-old-sessions", "DELETE-orphaned-projects"):
+                steps[action], moved[action] = self._backup_victims(
+                    backup_dir, self.claude_dir / "projects", infos, name
+                )
+            else:
+                with open(backup_dir / f"deleted-{name}.json", "w") as f:
+                    json.dump(infos, f, indent=2)
+        if not backed_up:
+            self._commit_backup(backup_dir)
+
+        # Then delete in a single pass
+        recreate = {str(path) for _, path in self._cache_dirs()}
+        gone = set(self._remove([Path(str(info["path"])) for infos in steps.values() for info in infos]))
+        for action, infos in steps.items():
+            removed = len(moved[action])
+            freed = sum(int(info["size"]) for info in moved[action])
+            for info in infos:
+                path = Path(str(info["path"]))
+                if path not in gone:
+                    continue
+                if action == "DELETE-cache-dirs" and str(path) in recreate:
+                    path.mkdir(parents=True, exist_ok=True)  # Recreate empty
+                removed += 1
+                freed += int(info["size"])
+            per_action[action] = {
+                "removed": removed,
+                "size_freed": freed,
+                "size_freed_human": format_size(freed),
+            }
+
+        size_freed = sum(int(summary["size_freed"]) for summary in per_action.values())
+        result: ResultDict = {
+            "status": "partial" if self.permission_errors else "success",
+            **summary,
+            "actions": per_action,
+            "size_freed": size_freed,
+            "size_freed_human": format_size(size_freed),
+            "backup": str(backup_dir),
+            "message": f"Ran {len(steps)} actions, freed {format_size(size_freed)}",
+            "restore_cmd": f"python3 {__file__} restore-backup --timestamp {backup_dir.name}",
+        }
+        if self.permission_errors:
+            result["failed"] = len(self.permission_errors)
+            result["errors"] = self.permission_errors
+        return result
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -905,13 +2734,25 @@ def main() -> None:
             "DELETE-orphaned-projects",
             "DELETE-old-sessions",
             "DELETE-auth-config",
+            "SLIM-claude-json",
             "disable-nonessential",
             "set-cleanup-period",
+            "plan",
+            "free",
             "list-backups",
             "restore-backup",
+            "gc-backups",
+            "prune-backups",
+            "purge-trash",
         ],
         help="Action to execute",
     )
+    parser.add_argument(
+        "plan_actions",
+        nargs="*",
+        metavar="PLAN_ACTION",
+        help=f"Actions for plan, any of: {', '.join(PLAN_ACTIONS)}",
+    )
     parser.add_argument(
         "--preview",
         action="store_true",
@@ -923,26 +2764,147 @@ def main() -> None:
         action="store_true",
         help="Actually execute destructive action",
     )
+    parser.add_argument(
+        "--target",
+        type=parse_size,
+        metavar="SIZE",
+        help="Size to bring ~/.claude under for free (e.g. 2G)",
+    )
     parser.add_argument(
         "--days",
         type=int,
         default=30,
         help="Days threshold for prune operations (default: 30)",
     )
+    parser.add_argument(
+        "--keep",
+        type=int,
+        default=50,
+        help="Newest history entries to keep per project for SLIM-claude-json (default: 50)",
+    )
+    parser.add_argument(
+        "--backup-mode",
+        choices=["tar", "move", "dedup"],
+        default="tar",
+        help="tar: archive deleted session/project data (default); "
+        "move: rename it into the backup dir, no copy (same filesystem only); "
+        "dedup: store each file once by content hash in ~/.claude-backups/objects",
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(1, 10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar="1-9",
+        help=f"gzip level for backup archives (default: {DEFAULT_COMPRESS_LEVEL})",
+    )
+    parser.add_argument(
+        "--compress-threads",
+        type=int,
+        default=DEFAULT_COMPRESS_THREADS,
+        help=f"Threads compressing backup archives (default: {DEFAULT_COMPRESS_THREADS})",
+    )
+    parser.add_argument(
+        "--throttle",
+        type=parse_size,
+        metavar="SIZE",
+        help="Run in the background: read at most SIZE per second for backups (e.g. 20M), "
+        "cap unlinks per second, and use idle I/O and CPU priority",
+    )
+    parser.add_argument(
+        "--throttle-unlinks",
+        type=float,
+        default=DEFAULT_THROTTLE_UNLINKS,
+        metavar="N",
+        help=f"With --throttle, unlinks per second (default: {DEFAULT_THROTTLE_UNLINKS})",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last interrupted --confirm run of this action instead of starting over",
+    )
+    parser.add_argument(
+        "--background-delete",
+        action="store_true",
+        help="Rename victims into ~/.claude/.trash and return; a detached purge-trash deletes them",
+    )
+    parser.add_argument(
+        "--delete-threads",
+        type=int,
+        default=DEFAULT_DELETE_THREADS,
+        help=f"Threads unlinking files (default: {DEFAULT_DELETE_THREADS})",
+    )
+    parser.add_argument(
+        "--from-report",
+        metavar="FILE",
+        help="Act on the candidates in a cc-disk-scan.py --json report ('-' for stdin) instead of rescanning",
+    )
     parser.add_argument(
         "--timestamp",
         type=str,
         help="Timestamp for restore-backup action",
     )
+    parser.add_argument(
+        "--path",
+        action="append",
+        metavar="GLOB",
+        help="restore-backup: only restore original paths matching GLOB (repeatable)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="list-backups: re-measure every backup and check it against its recorded size and checksums",
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=None,
+        help="prune-backups: keep the N newest backups",
+    )
+    parser.add_argument(
+        "--keep-daily",
+        type=int,
+        default=None,
+        help="prune-backups: keep the newest backup of each of the last N days with backups",
+    )
+    parser.add_argument(
+        "--keep-weekly",
+        type=int,
+        default=None,
+        help="prune-backups: keep the newest backup of each of the last N weeks with backups",
+    )
+    parser.add_argument(
+        "--max-total-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="prune-backups: evict the oldest backups until the rest fit in SIZE (e.g. 2G)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Output JSON result")
 
     args = parser.parse_args()
 
+    read_bucket = unlink_bucket = None
+    priority: List[str] = []
+    if args.throttle is not None:
+        # Before any pool starts, so every worker thread inherits the priority
+        priority = lower_priority()
+        read_bucket = TokenBucket(max(1, args.throttle))
+        unlink_bucket = TokenBucket(max(1.0, args.throttle_unlinks))
+
+    if args.action == "plan":
+        unknown = [a for a in args.plan_actions if a not in PLAN_ACTIONS]
+        if not args.plan_actions or unknown:
+            parser.error(f"plan needs one or more of: {', '.join(PLAN_ACTIONS)}")
+    elif args.plan_actions:
+        parser.error(f"unexpected arguments: {' '.join(args.plan_actions)}")
+    if args.action == "free" and args.target is None:
+        parser.error("free needs --target SIZE")
+
     # Handle backup management actions
     if args.action == "list-backups":
         backup_mgr = BackupManager()
-        backups = backup_mgr.list_backups()
+        backups = backup_mgr.list_backups(verify=args.verify)
         if args.json:
             print(json.dumps(backups, indent=2))
         else:
@@ -951,7 +2913,14 @@ def main() -> None:
             else:
                 print(f"\nBackups in {BACKUP_ROOT}:\n")
                 for b in backups:
-                    print(f"  {b['timestamp']} - {b.get('action', 'unknown')} ({b['size_human']})")
+                    status = ""
+                    if args.verify:
+                        status = {True: " OK", None: " UNVERIFIED"}.get(
+                            b["verified"], f" FAILED: {'; '.join(b['problems'])}"
+                        )
+                    print(f"  {b['timestamp']} - {b.get('action', 'unknown')} ({b['size_human']}){status}")
+        if args.verify and any(b["verified"] is False for b in backups):
+            sys.exit(1)
         return
 
     if args.action == "restore-backup":
@@ -959,7 +2928,7 @@ def main() -> None:
             print("ERROR: --timestamp required for restore-backup")
             sys.exit(1)
         backup_mgr = BackupManager()
-        result = backup_mgr.restore(args.timestamp)
+        result = backup_mgr.restore(args.timestamp, args.path)
         if args.json:
             print(json.dumps(result, indent=2))
         else:
@@ -968,10 +2937,68 @@ def main() -> None:
             print(result.get("message", ""))
         return
 
+    if args.action == "gc-backups":
+        result = BackupManager().gc_objects(args.confirm)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"\n[{str(result.get('status', 'unknown')).upper()}] gc-backups")
+            if result.get("status") == "preview":
+                print(f"{len(result['files'])} unreferenced objects ({result['total_size_human']}), "
+                      f"{result['kept']} kept. Run with --confirm to delete them.")
+            else:
+                print(result.get("message") or result.get("reason", ""))
+        return
+
+    if args.action == "prune-backups":
+        policy = [args.keep_last, args.keep_daily, args.keep_weekly, args.max_total_size]
+        if all(value is None for value in policy):
+            parser.error("prune-backups needs --keep-last, --keep-daily, --keep-weekly or --max-total-size")
+        keep_last, keep_daily, keep_weekly = (None if n is None else max(0, n) for n in policy[:3])
+        result = BackupManager().prune(args.confirm, keep_last, keep_daily, keep_weekly, args.max_total_size)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"\n[{str(result.get('status', 'unknown')).upper()}] prune-backups")
+            if result.get("status") == "preview":
+                for f in result["files"]:
+                    print(f"  {f['path']} - {f['action']} ({f['size_human']})")
+                print(f"\n{len(result['files'])} backups ({result['total_size_human']}) would be removed, "
+                      f"{len(result['kept'])} kept. Run with --confirm to delete them.")
+                for reason in result.get("kept_unfinished", []):
+                    print(f"  kept {reason}")
+            else:
+                print(result.get("message") or result.get("reason", ""))
+                for err in result.get("errors", [])[:5]:
+                    print(f"  {err}")
+                for reason in result.get("kept_unfinished", []):
+                    print(f"  kept {reason}")
+                if "note" in result:
+                    print(result["note"])
+        return
+
     action = args.action
 
+    report = None
+    report_size = None
+    if args.from_report:
+        try:
+            report, report_size = load_report(args.from_report)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Cannot read scan report {args.from_report}: {e}")
+            sys.exit(1)
+
     executor = ActionExecutor(
-        preview=not args.confirm, confirm=args.confirm, verbose=args.verbose
+        preview=not args.confirm,
+        confirm=args.confirm,
+        verbose=args.verbose,
+        report=report,
+        report_size=report_size,
+        backup_mode=args.backup_mode,
+        backup_mgr=BackupManager(args.compress_level, max(1, args.compress_threads), read_bucket),
+        deleter=DeletionEngine(max(1, args.delete_threads), unlink_bucket),
+        background_delete=args.background_delete,
+        resume=args.resume,
     )
 
     action_map = {
@@ -982,8 +3009,12 @@ def main() -> None:
         "DELETE-orphaned-projects": executor.delete_orphaned_projects,
         "DELETE-old-sessions": lambda: executor.delete_old_sessions(args.days),
         "DELETE-auth-config": executor.delete_auth_config,
+        "SLIM-claude-json": lambda: executor.slim_claude_json(max(0, args.keep)),
         "disable-nonessential": executor.disable_nonessential_traffic,
         "set-cleanup-period": lambda: executor.set_cleanup_period(args.days),
+        "plan": lambda: executor.plan(list(dict.fromkeys(args.plan_actions)), args.days),
+        "free": lambda: executor.free(args.target, args.days),
+        "purge-trash": executor.purge_trash,
     }
 
     try:
@@ -992,6 +3023,26 @@ def main() -> None:
         result = {"status": "error", "message": str(e)}
     except Exception as e:
         result = {"status": "error", "message": f"Unexpected error: {e}"}
+    if executor.stale:
+        result["stale"] = executor.stale
+    compression = executor.backup_mgr.compression_stats()
+    if compression:
+        result["compression"] = compression
+    deletion = executor.deleter.stats()
+    if deletion:
+        result["deletion"] = deletion
+    if read_bucket is not None and unlink_bucket is not None:
+        result["throttle"] = {
+            "bytes_per_sec": read_bucket.rate,
+            "unlinks_per_sec": unlink_bucket.rate,
+            "waited_seconds": round(read_bucket.waited + unlink_bucket.waited, 3),
+            "priority": priority,
+        }
+    if executor.resumed is not None:
+        result["resumed"] = str(executor.resumed.backup_dir)
+    if executor.purger_pid is not None:
+        result["staged"] = str(executor.staging_dir)
+        result["purger_pid"] = executor.purger_pid
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -1014,7 +3065,22 @@ def main() -> None:
                 if len(files_raw) > 10:
                     print(f"  ... and {len(files_raw) - 10} more files")
 
+            actions_raw = result.get("actions")
+            if isinstance(actions_raw, dict):
+                print("\nPer action:")
+                for name, summary in actions_raw.items():
+                    print(f"  {name}: {summary['files']} paths, {summary['total_size_human']}")
+
             print(f"\nTotal size: {result.get('total_size_human', '?')}")
+            if "target" in result:
+                print(f"Size: {result['current_size_human']} now, {result['projected_size_human']} after "
+                      f"(target {result['target_human']})")
+            if "shortfall" in result:
+                print(f"\n⚠️  WARNING: every candidate together still leaves {result['shortfall_human']} "
+                      f"over the target")
+
+            if executor.stale:
+                print(f"\nSkipped {len(executor.stale)} paths that changed since the scan")
 
             if "warning" in result:
                 print(f"\n⚠️  WARNING: {result['warning']}")
@@ -1030,6 +3096,25 @@ def main() -> None:
             print(result.get("message", ""))
             if "size_freed_human" in result:
                 print(f"Freed: {result['size_freed_human']}")
+            actions_raw = result.get("actions")
+            if isinstance(actions_raw, dict):
+                for name, summary in actions_raw.items():
+                    print(f"  {name}: {summary['removed']} removed, {summary['size_freed_human']}")
+            if executor.stale:
+                print(f"Skipped: {len(executor.stale)} paths that changed since the scan")
+            if compression:
+                print(f"Backup archived at {compression['mb_per_sec']} MB/s "
+                      f"({compression['threads']} threads, level {compression['level']})")
+            if deletion:
+                print(f"Deleted {deletion['files']} files at {deletion['files_per_sec']} files/s "
+                      f"({deletion['threads']} threads)")
+            if "throttle" in result:
+                throttle = result["throttle"]
+                print(f"Throttled to {format_size(int(throttle['bytes_per_sec']))}/s and "  # type: ignore[index]
+                      f"{throttle['unlinks_per_sec']:g} unlinks/s, "  # type: ignore[index]
+                      f"waited {throttle['waited_seconds']}s")  # type: ignore[index]
+            if executor.purger_pid is not None:
+                print(f"Staged in {executor.staging_dir}; purging in the background (pid {executor.purger_pid})")
             if "backup" in result:
                 print(f"Backup: {result['backup']}")
             if "restore_cmd" in result:
@@ -5,7 +5,7 @@ Analyzes ~/.claude/ disk usage and identifies cleanup opportunities.
 Shows visual disk usage chart by default, or JSON for scripting.
 
 Usage:
-    python3 cc-disk-scan.py [--verbose] [--json]
+    python3 cc-disk-scan.py [--verbose] [--json] [--slow-ops] [--no-cache] [--rebuild-cache] [--workers N]
 """
 
 import argparse
@@ -14,10 +14,13 @@ import os
 import platform
 import re
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Tuple
+from typing import Callable, List, Dict, Iterator, Optional, TypeVar, Union, Tuple
 
 # Type aliases for structured data
 JsonPrimitive = Union[str, int, float, bool, None]
@@ -52,6 +55,29 @@ class FilePreview:
     size: int
     size_human: str
     age_days: int = 0
+    mtime: float = 0.0  # st_mtime at scan time; fix actions re-stat against it
+
+
+@dataclass
+class CandidateSet:
+    """Paths a detector found for one remediation action, with their sizes and ages."""
+    action_id: str
+    items: List[FilePreview]
+
+    @property
+    def total_size(self) -> int:
+        return sum(item.size for item in self.items)
+
+
+def dir_preview(node: "DirNode") -> FilePreview:
+    """Preview of an indexed directory, sized from the index."""
+    return FilePreview(
+        path=node.path,
+        size=node.size,
+        size_human=format_size(node.size),
+        age_days=age_days(node.mtime),
+        mtime=node.mtime,
+    )
 
 
 @dataclass
@@ -67,6 +93,49 @@ class RemediationAction:
     notes: str = ""
 
 
+# Safety level of each cleanup action, shared with cc-disk-fix.py's free optimizer
+ACTION_SAFETY = {
+    "DELETE-cache-dirs": "safe",
+    "DELETE-debug-logs": "safe",
+    "DELETE-old-plugin-versions": "caution",
+    "DELETE-plugin-cache": "caution",
+    "DELETE-orphaned-projects": "destructive",
+    "DELETE-old-sessions": "destructive",
+}
+
+
+@dataclass
+class PluginUsage:
+    name: str
+    size: int
+    versions: int
+    old_versions_size: int  # everything but the latest version
+
+
+@dataclass
+class DiskUsage:
+    """Where the bytes under ~/.claude are, as drawn by the disk chart."""
+    total_size: int
+    plugin_cache_size: int
+    plugins: List[PluginUsage]  # largest first
+    active_projects: int
+    active_projects_size: int
+    orphaned_projects: int
+    orphaned_projects_size: int
+
+    @property
+    def projects_size(self) -> int:
+        return self.active_projects_size + self.orphaned_projects_size
+
+    @property
+    def other_size(self) -> int:
+        return self.total_size - self.plugin_cache_size - self.projects_size
+
+    @property
+    def old_versions_size(self) -> int:
+        return sum(plugin.old_versions_size for plugin in self.plugins)
+
+
 @dataclass
 class ScanReport:
     created_at: str
@@ -75,6 +144,71 @@ class ScanReport:
     metrics: MetricsInfo
     findings: List[Finding]
     actions: List[RemediationAction]
+    disk_usage: Optional[DiskUsage] = None
+    timings_ms: Dict[str, float] = field(default_factory=dict)  # wall time per input and detector
+
+
+@dataclass
+class DetectorSpec:
+    name: str  # ClaudeCodeScanner method
+    inputs: Tuple[str, ...]  # scan inputs, passed to the method as arguments in order
+
+
+# Registered in definition order, which is also the order findings are reported in
+DETECTORS: List[DetectorSpec] = []
+DetectorFunc = TypeVar("DetectorFunc", bound=Callable[..., Optional["Finding"]])
+
+
+def detector(*inputs: str) -> Callable[[DetectorFunc], DetectorFunc]:
+    """Register a ClaudeCodeScanner method as a detector of the given scan inputs.
+
+    Inputs are "metrics", "tree_index", "log_index" (debug/latest pattern
+    stats), "slow_ops" and "backup_usage"; a detector runs as soon as its
+    inputs are ready.
+    """
+    def register(func: DetectorFunc) -> DetectorFunc:
+        DETECTORS.append(DetectorSpec(func.__name__, inputs))
+        return func
+    return register
+
+
+# A unit of scan work: (callable, names of the tasks whose results it is called with)
+ScanTask = Tuple[Callable[..., object], Tuple[str, ...]]
+
+
+def run_task_graph(tasks: Dict[str, ScanTask], workers: int) -> Tuple[Dict[str, object], Dict[str, float]]:
+    """Run tasks on a thread pool as soon as their dependencies finish.
+
+    Each task is called with its dependencies' results as positional
+    arguments. Only this thread waits on futures, so tasks never deadlock
+    the pool.
+    Returns (results, wall time in ms) keyed by task name.
+    """
+    results: Dict[str, object] = {}
+    timings: Dict[str, float] = {}
+    pending = dict(tasks)
+    running: Dict[Future, str] = {}
+
+    def timed(name: str, func: Callable[..., object], args: List[object]) -> object:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while pending or running:
+            for name, (func, deps) in list(pending.items()):
+                if all(dep in results for dep in deps):
+                    args = [results[dep] for dep in deps]
+                    running[pool.submit(timed, name, func, args)] = name
+                    del pending[name]
+            if not running:
+                raise ValueError(f"Unsatisfiable scan dependencies: {sorted(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return results, {name: timings[name] for name in tasks}
 
 
 def format_size(bytes_val: int) -> str:
@@ -88,35 +222,747 @@ def format_size(bytes_val: int) -> str:
     return f"{bytes_val}B"
 
 
-def get_dir_size(path: Path) -> int:
-    """Get total size of directory in bytes (cross-platform)."""
-    if not path.exists():
-        return 0
-    total = 0
-    try:
-        for entry in path.rglob("*"):
-            if entry.is_file():
+def age_days(mtime: float) -> int:
+    """Convert an mtime to an age in whole days."""
+    return int((datetime.now().timestamp() - mtime) / 86400)
+
+
+def project_original_path(dir_name: str) -> str:
+    """Convert a project dir name back to its path (-Users-chris-foo → /Users/chris/foo)."""
+    return "/" + dir_name.lstrip("-").replace("-", "/")
+
+
+class DirNode:
+    """Recursive aggregates for one directory in a TreeIndex."""
+
+    __slots__ = ("path", "mtime", "dirs", "files", "size", "file_count",
+                 "newest_mtime", "oldest_mtime")
+
+    def __init__(self, path: str, mtime: float) -> None:
+        self.path = path
+        self.mtime = mtime  # the directory's own mtime
+        self.dirs: Dict[str, "DirNode"] = {}
+        self.files: Dict[str, Tuple[int, float]] = {}  # name: (size, mtime)
+        self.size = 0  # apparent size of all files below this directory
+        self.file_count = 0
+        self.newest_mtime = 0.0
+        self.oldest_mtime = 0.0  # 0 when the subtree holds no files
+
+    def _merge_mtimes(self, newest: float, oldest: float) -> None:
+        if newest > self.newest_mtime:
+            self.newest_mtime = newest
+        if oldest and (not self.oldest_mtime or oldest < self.oldest_mtime):
+            self.oldest_mtime = oldest
+
+    def add_file(self, name: str, size: int, mtime: float) -> None:
+        self.files[name] = (size, mtime)
+        self.size += size
+        self.file_count += 1
+        self._merge_mtimes(mtime, mtime)
+
+    def add_dir(self, name: str, child: "DirNode") -> None:
+        self.dirs[name] = child
+        self.size += child.size
+        self.file_count += child.file_count
+        self._merge_mtimes(child.newest_mtime, child.oldest_mtime)
+
+
+# Per-directory cache entry: [[st_dev, st_ino, st_mtime_ns], [[file, size, mtime], ...], [subdir, ...]]
+CacheEntry = List[list]
+
+INDEX_CACHE_VERSION = 2
+# Only installed plugin versions are cached: they are written once, while
+# session and log files are appended in place, which does not touch the
+# directory's mtime. ("*" matches any name; everything below is included.)
+INDEX_CACHE_TREES: List[Tuple[str, ...]] = [
+    ("plugins", "cache", "*", "*", "*"),
+]
+# Directories with a file modified this recently are never cached (a plugin
+# update may still be unpacking)
+INDEX_CACHE_HOT_SECONDS = 24 * 3600
+
+
+def _dir_key(st: os.stat_result) -> List[int]:
+    """Cache key for a directory: (st_dev, st_ino, st_mtime_ns)."""
+    return [st.st_dev, st.st_ino, st.st_mtime_ns]
+
+
+# Directories the walk descends itself; each of their other subdirectories is
+# an independent subtree handed to the worker pool ("*" matches any name).
+INDEX_FANOUT_PARENTS: List[Tuple[str, ...]] = [
+    (),
+    ("projects",),
+    ("plugins",),
+    ("plugins", "cache"),
+    ("plugins", "cache", "*"),
+]
+
+
+# Walking is latency-bound on network and WSL /mnt paths, so use more threads than cores
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+
+def _is_fanout_parent(rel: Tuple[str, ...]) -> bool:
+    return any(
+        len(rel) == len(pattern) and all(p in ("*", r) for p, r in zip(pattern, rel))
+        for pattern in INDEX_FANOUT_PARENTS
+    )
+
+
+def _is_cacheable(rel: Tuple[str, ...]) -> bool:
+    return any(
+        len(rel) >= len(pattern) and all(p in ("*", r) for p, r in zip(pattern, rel))
+        for pattern in INDEX_CACHE_TREES
+    )
+
+
+class TreeIndex:
+    """In-memory index of a directory tree built from a single scandir walk.
+
+    Every detector, the action previews and the disk chart answer size,
+    count and age questions from this index instead of re-walking the tree.
+
+    With a cache_path, directory listings inside INDEX_CACHE_TREES are
+    persisted keyed by (st_dev, st_ino, st_mtime_ns). On the next run a
+    directory whose key is unchanged reuses its cached file entries, so only
+    its subdirectories are lstat'ed instead of every file. Everything else
+    is always read from disk, since files there grow in place. Recently
+    written directories are skipped (see INDEX_CACHE_HOT_SECONDS); use
+    rebuild=True to discard the cache.
+
+    With workers > 1, independent subtrees (each project, each plugin, each
+    top-level cache dir) are walked on a thread pool. Children are always
+    merged in name order, so the index is identical to a serial walk.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        cache_path: Optional[Path] = None,
+        rebuild: bool = False,
+        workers: int = 1,
+    ):
+        self.root = root
+        self.root_node: Optional[DirNode] = None
+        self.cache_path = cache_path
+        self.reused_dirs = 0
+        self.scanned_dirs = 0
+        self._stats_lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._old_cache: Dict[str, CacheEntry] = {}
+        self._new_cache: Dict[str, CacheEntry] = {}
+        self._hot_after = datetime.now().timestamp() - INDEX_CACHE_HOT_SECONDS
+
+        if cache_path and not rebuild:
+            self._old_cache = self._load_cache(cache_path)
+
+        try:
+            st = os.stat(root)
+        except (PermissionError, OSError):
+            return
+        if os.path.isdir(root):
+            self.root_node = DirNode(str(root), st.st_mtime)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    self._pool = pool
+                    self._fill(self.root_node, _dir_key(st), ())
+                self._pool = None
+            else:
+                self._fill(self.root_node, _dir_key(st), ())
+
+        if cache_path:
+            self._save_cache(cache_path)
+        self._old_cache = {}
+
+    def _load_cache(self, cache_path: Path) -> Dict[str, CacheEntry]:
+        try:
+            with open(cache_path, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, PermissionError, OSError):
+            return {}
+        if data.get("version") != INDEX_CACHE_VERSION or data.get("root") != str(self.root):
+            return {}
+        return data.get("dirs", {})
+
+    def _save_cache(self, cache_path: Path) -> None:
+        """Write the cache atomically; a read-only config dir just means no cache."""
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": INDEX_CACHE_VERSION, "root": str(self.root),
+                           "dirs": self._new_cache}, f, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except (PermissionError, OSError):
+            pass
+
+    def _fill(self, node: DirNode, key: List[int], rel: Tuple[str, ...]) -> None:
+        """Populate node from the cache or from disk, without following dir symlinks."""
+        cacheable = _is_cacheable(rel)
+        cached = self._old_cache.get(node.path) if cacheable else None
+        if cached is not None and cached[0] == key:
+            files = cached[1]
+            complete = True
+            for name, size, mtime in files:
+                node.add_file(name, size, mtime)
+            children = []
+            for name in cached[2]:
                 try:
-                    total += entry.stat().st_size
+                    children.append((name, os.lstat(os.path.join(node.path, name))))
                 except (PermissionError, OSError):
-                    pass
-    except (PermissionError, OSError):
-        pass
-    return total
+                    continue
+            with self._stats_lock:
+                self.reused_dirs += 1
+        else:
+            files, children, complete = self._scan(node)
+            with self._stats_lock:
+                self.scanned_dirs += 1
+
+        # Only the thread walking a fan-out parent submits work, and pool
+        # threads never wait on the pool, so the walk cannot deadlock.
+        pool = self._pool if _is_fanout_parent(rel) else None
+        pending: List[Tuple[str, DirNode, List[int], Tuple[str, ...], Optional[Future]]] = []
+        for name, st in children:
+            child = DirNode(os.path.join(node.path, name), st.st_mtime)
+            child_key = _dir_key(st)
+            child_rel = rel + (name,)
+            future = None
+            if pool is not None and not _is_fanout_parent(child_rel):
+                future = pool.submit(self._fill, child, child_key, child_rel)
+            pending.append((name, child, child_key, child_rel, future))
+        for name, child, child_key, child_rel, future in pending:
+            if future is None:
+                self._fill(child, child_key, child_rel)
+            else:
+                future.result()
+            node.add_dir(name, child)
+
+        if cacheable and complete and not any(row[2] > self._hot_after for row in files):
+            self._new_cache[node.path] = [key, files, [name for name, _ in children]]
+
+    def _scan(self, node: DirNode) -> Tuple[List[list], List[Tuple[str, os.stat_result]], bool]:
+        """Read one directory from disk, one stat per entry.
+
+        Files are added to node; subdirectories are returned as (name, lstat)
+        for the caller to walk. Incomplete listings are not cached.
+        """
+        files: List[list] = []
+        children: List[Tuple[str, os.stat_result]] = []
+        complete = True
+        try:
+            with os.scandir(node.path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (PermissionError, OSError):
+            return files, children, False
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    children.append((entry.name, entry.stat(follow_symlinks=False)))
+                elif entry.is_file():
+                    st = entry.stat()
+                    node.add_file(entry.name, st.st_size, st.st_mtime)
+                    files.append([entry.name, st.st_size, st.st_mtime])
+            except (PermissionError, OSError):
+                complete = False
+        return files, children, complete
+
+    def node(self, path: Path) -> Optional[DirNode]:
+        """Return the node for a directory inside the tree, or None."""
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return None
+        node = self.root_node
+        for part in parts:
+            if node is None:
+                return None
+            node = node.dirs.get(part)
+        return node
+
+    def size(self, path: Path) -> int:
+        """Total apparent size of a directory (0 if missing)."""
+        node = self.node(path)
+        return node.size if node else 0
+
+    def file_count(self, path: Path) -> int:
+        """Number of files below a directory (0 if missing)."""
+        node = self.node(path)
+        return node.file_count if node else 0
+
+    def file_stat(self, path: Path) -> Optional[Tuple[int, float]]:
+        """(size, mtime) for a single indexed file, or None."""
+        parent = self.node(path.parent)
+        return parent.files.get(path.name) if parent else None
+
+    def subdirs(self, path: Path) -> List[DirNode]:
+        """Immediate subdirectories of a directory, sorted by name."""
+        node = self.node(path)
+        return list(node.dirs.values()) if node else []
+
+    def iter_files(self, path: Path, suffix: str = "") -> Iterator[Tuple[str, int, float]]:
+        """Yield (path, size, mtime) for every file below a directory."""
+        node = self.node(path)
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            for name, (size, mtime) in current.files.items():
+                if name.endswith(suffix):
+                    yield os.path.join(current.path, name), size, mtime
+            stack.extend(reversed(list(current.dirs.values())))
+
+
+# Structural characters of JSON; strings are handled separately so that
+# brackets and commas inside them are never mistaken for structure.
+JSON_STRUCTURE = re.compile(rb'["{}\[\]:,]')
+# Rest of a string after its opening quote, up to and including the closing quote
+JSON_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket or unterminated string: used to skip
+# nested values whose keys and separators are not needed
+JSON_SKIP_NESTED = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+# Keys longer than this are not tracked (project keys are paths)
+JSON_MAX_KEY_BYTES = 4096
+
+
+class _JsonFrame:
+    """One open object or array while streaming a JSON document."""
+
+    __slots__ = ("is_object", "start", "count", "commas", "has_value", "key",
+                 "value_start", "value_entries", "expect_key", "comma_offsets")
+
+    def __init__(self, is_object: bool, start: int) -> None:
+        self.is_object = is_object
+        self.start = start
+        self.count = 0  # keys seen (objects)
+        self.commas = 0  # separators seen (arrays)
+        self.has_value = False  # at least one element seen (arrays)
+        self.key: Optional[str] = None  # key whose value is being read (objects)
+        self.value_start = 0
+        self.value_entries = 0  # entries of the container value just closed
+        self.expect_key = True
+        self.comma_offsets: Optional[List[int]] = None  # recorded for history arrays
+
+    def entries(self) -> int:
+        if self.is_object:
+            return self.count
+        return self.commas + 1 if self.has_value else 0
 
 
-def get_file_count(path: Path) -> int:
-    """Count files in directory."""
-    if not path.exists():
-        return 0
-    count = 0
-    try:
-        for entry in path.rglob("*"):
-            if entry.is_file():
-                count += 1
-    except (PermissionError, OSError):
-        pass
-    return count
+@dataclass
+class JsonKeyStats:
+    bytes: int = 0
+    entries: int = 0  # array length / object key count (0 for scalars)
+
+
+@dataclass
+class ClaudeJsonProfile:
+    """Byte sizes and entry counts of ~/.claude.json without loading it."""
+    keys: Dict[str, JsonKeyStats] = field(default_factory=dict)
+    projects: Dict[str, JsonKeyStats] = field(default_factory=dict)  # entries = history length
+    # project: (offset of "[", offset of "]", offsets of the separating commas)
+    history_spans: Dict[str, Tuple[int, int, List[int]]] = field(default_factory=dict)
+
+
+class ClaudeJsonProfiler:
+    """Streaming, constant-memory profiler for ~/.claude.json.
+
+    Feeds the file through in fixed-size chunks and tracks only bracket
+    depth, the keys of the top level and of the "projects" map, and byte
+    offsets, so no Python objects are built for the (possibly 100MB+)
+    document. Memory is bounded by the chunk size.
+
+    With record_history=True the byte offsets of every project's "history"
+    array and its separators are kept too, so a writer can drop entries
+    by copying byte ranges.
+    """
+
+    def __init__(self, record_history: bool = False) -> None:
+        self.profile = ClaudeJsonProfile()
+        self.record_history = record_history
+        self._stack: List[_JsonFrame] = []
+        self._offset = 0  # absolute offset of the current chunk
+        self._in_string = False
+        self._escape_pending = False
+        self._string_start = 0
+        self._key_parts: Optional[List[bytes]] = None  # collected key bytes, if tracked
+        self._key_len = 0
+
+    def _skipping(self) -> bool:
+        """Whether we are inside a value that only needs bracket balancing.
+
+        Detail is needed for the top-level keys, the "projects" map, each
+        project's keys and the separators of its "history" array.
+        """
+        depth = len(self._stack)
+        if depth <= 2:
+            return False
+        return depth >= 5 or self._stack[0].key != "projects"
+
+    def _tracks_key(self) -> bool:
+        """Whether the string being opened is a key we need the text of."""
+        if not self._stack:
+            return False
+        frame = self._stack[-1]
+        return frame.is_object and frame.expect_key and len(self._stack) <= 3
+
+    def feed(self, chunk: bytes) -> None:
+        pos = 0
+        end = len(chunk)
+        while pos < end:
+            if self._in_string:
+                if self._escape_pending:
+                    self._escape_pending = False
+                    self._collect_key(chunk[pos:pos + 1])
+                    pos += 1
+                    continue
+                m = JSON_STRING_TAIL.match(chunk, pos)
+                if m is None:
+                    rest = chunk[pos:]
+                    trailing = len(rest) - len(rest.rstrip(b"\\"))
+                    self._escape_pending = trailing % 2 == 1
+                    self._collect_key(rest)
+                    break
+                self._collect_key(chunk[pos:m.end() - 1])
+                self._in_string = False
+                self._end_string()
+                pos = m.end()
+                continue
+
+            if self._skipping():
+                pos = JSON_SKIP_NESTED.match(chunk, pos).end()  # type: ignore[union-attr]
+                if pos < end:
+                    self._structure(chunk[pos], self._offset + pos)
+                    pos += 1
+                continue
+
+            m = JSON_STRUCTURE.search(chunk, pos)
+            token_pos = m.start() if m else end
+            if token_pos > pos and self._stack and not self._stack[-1].has_value:
+                if chunk[pos:token_pos].strip():
+                    self._stack[-1].has_value = True  # scalar array element
+            if m is None:
+                break
+            self._structure(chunk[token_pos], self._offset + token_pos)
+            pos = token_pos + 1
+        self._offset += end
+
+    def _collect_key(self, data: bytes) -> None:
+        if self._key_parts is not None and data:
+            self._key_len += len(data)
+            if self._key_len > JSON_MAX_KEY_BYTES:
+                self._key_parts = None
+            else:
+                self._key_parts.append(data)
+
+    def _end_string(self) -> None:
+        frame = self._stack[-1] if self._stack else None
+        if frame is None:
+            return
+        if frame.is_object and frame.expect_key:
+            frame.count += 1
+            frame.key = None
+            if self._key_parts is not None:
+                raw = b"".join(self._key_parts)
+                try:
+                    frame.key = json.loads(b'"' + raw + b'"')
+                except ValueError:
+                    frame.key = raw.decode("utf-8", "replace")
+            self._key_parts = None
+        else:
+            frame.has_value = True
+            frame.value_entries = 0
+
+    def _structure(self, ch: int, offset: int) -> None:
+        stack = self._stack
+        frame = stack[-1] if stack else None
+        if ch == 0x22:  # "
+            self._in_string = True
+            self._string_start = offset
+            self._key_parts = [] if self._tracks_key() else None
+            self._key_len = 0
+        elif ch in (0x7B, 0x5B):  # { [
+            if frame is not None:
+                frame.has_value = True
+            new_frame = _JsonFrame(ch == 0x7B, offset)
+            if self.record_history and ch == 0x5B and self._at_history_value():
+                new_frame.comma_offsets = []
+            stack.append(new_frame)
+        elif ch in (0x7D, 0x5D):  # } ]
+            if frame is None:
+                return
+            if frame.is_object and frame.key is not None and not frame.expect_key:
+                self._record(len(stack) - 1, offset)
+            stack.pop()
+            if frame.comma_offsets is not None and stack[1].key is not None:
+                self.profile.history_spans[stack[1].key] = (frame.start, offset, frame.comma_offsets)
+            if stack:
+                stack[-1].value_entries = frame.entries()
+        elif ch == 0x3A:  # :
+            if frame is not None and frame.is_object:
+                frame.expect_key = False
+                frame.value_start = offset + 1
+                frame.value_entries = 0
+        elif ch == 0x2C:  # ,
+            if frame is None:
+                return
+            if frame.is_object:
+                if frame.key is not None:
+                    self._record(len(stack) - 1, offset)
+                frame.expect_key = True
+            else:
+                frame.commas += 1
+                if frame.comma_offsets is not None:
+                    frame.comma_offsets.append(offset)
+
+    def _at_history_value(self) -> bool:
+        """Whether the value about to open is a project's "history" array."""
+        stack = self._stack
+        return (len(stack) == 3 and stack[0].key == "projects"
+                and stack[2].key == "history" and not stack[2].expect_key)
+
+    def _record(self, depth: int, value_end: int) -> None:
+        """Record the value of the key just finished at stack depth."""
+        frame = self._stack[depth]
+        key = frame.key
+        if key is None:
+            return
+        size = value_end - frame.value_start
+        in_projects = depth >= 1 and self._stack[0].key == "projects"
+        if depth == 0:
+            self.profile.keys[key] = JsonKeyStats(size, frame.value_entries)
+        elif depth == 1 and in_projects:
+            stats = self.profile.projects.setdefault(key, JsonKeyStats())
+            stats.bytes = size
+        elif depth == 2 and in_projects and key == "history":
+            project = self._stack[1].key
+            if project is not None:
+                self.profile.projects.setdefault(project, JsonKeyStats()).entries = frame.value_entries
+
+
+def profile_claude_json(
+    path: Path, chunk_size: int = 1024 * 1024, record_history: bool = False
+) -> ClaudeJsonProfile:
+    """Profile a .claude.json file in fixed-size chunks."""
+    profiler = ClaudeJsonProfiler(record_history=record_history)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            profiler.feed(chunk)
+    return profiler.profile
+
+
+def iter_line_chunks(
+    path: Path, chunk_size: int = 1024 * 1024, max_line: int = 8 * 1024 * 1024
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield (file offset, data) chunks of a file cut at line boundaries.
+
+    Lines longer than max_line are split so memory stays bounded.
+    """
+    with open(path, "rb") as f:
+        carry = b""
+        base = 0  # file offset of carry[0]
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            if cut == 0 and len(data) < max_line:
+                carry = data
+                continue
+            if cut == 0:
+                cut = len(data)
+            yield base, data[:cut]
+            carry = data[cut:]
+            base += cut
+        if carry:
+            yield base, carry
+
+
+@dataclass
+class PatternStats:
+    """Occurrences of one registered pattern in a log file."""
+    count: int = 0
+    first_offset: int = -1  # byte offset of the first match
+    last_offset: int = -1  # byte offset of the last match
+
+
+class LogAnalyzer:
+    """One-pass, multi-pattern debug log scanner.
+
+    Detectors register named patterns up front; analyze() then reads a log
+    once, in bounded chunks. A single compiled alternation of all patterns
+    finds the lines worth a closer look, and only those lines are matched
+    against each pattern on its own, so one pattern never consumes text
+    another needs. Chunks are cut at line boundaries, so a (single-line)
+    match that straddles a chunk edge is still found.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024, max_line: int = 8 * 1024 * 1024):
+        self.chunk_size = chunk_size
+        self.max_line = max_line  # a longer line is matched in pieces
+        self._patterns: Dict[str, str] = {}
+        self._compiled: Optional[Tuple["re.Pattern[bytes]", Dict[str, "re.Pattern[bytes]"]]] = None
+
+    def register(self, name: str, pattern: str) -> None:
+        """Register a case-insensitive, single-line pattern under a name."""
+        self._patterns[name] = pattern
+        self._compiled = None
+
+    def _regexes(self) -> Tuple["re.Pattern[bytes]", Dict[str, "re.Pattern[bytes]"]]:
+        """(prefilter matching any pattern, each pattern on its own)."""
+        if self._compiled is None:
+            alternation = "|".join(f"(?:{pattern})" for pattern in self._patterns.values())
+            self._compiled = (
+                re.compile(alternation.encode(), re.IGNORECASE),
+                {name: re.compile(pattern.encode(), re.IGNORECASE) for name, pattern in self._patterns.items()},
+            )
+        return self._compiled
+
+    def analyze(self, path: Path) -> Dict[str, PatternStats]:
+        """Count every registered pattern in one pass over the file."""
+        stats = {name: PatternStats() for name in self._patterns}
+        if not self._patterns:
+            return stats
+        prefilter, regexes = self._regexes()
+        for base, text in iter_line_chunks(path, self.chunk_size, self.max_line):
+            pos = 0
+            while True:
+                hit = prefilter.search(text, pos)
+                if hit is None:
+                    break
+                line_start = text.rfind(b"\n", 0, hit.start()) + 1
+                line_end = text.find(b"\n", hit.start())
+                if line_end == -1:
+                    line_end = len(text)
+                for name, regex in regexes.items():
+                    entry = stats[name]
+                    for m in regex.finditer(text, line_start, line_end):
+                        offset = base + m.start()
+                        if entry.count == 0:
+                            entry.first_offset = offset
+                        entry.last_offset = offset
+                        entry.count += 1
+                pos = line_end + 1
+        return stats
+
+
+# A slow-operation line, e.g.
+#   2026-02-04T18:30:00.123Z [WARN] SLOW OPERATION DETECTED: fs.readdir took 1500ms
+#   ... SLOW OPERATION DETECTED: execSyncWithDefaults (812.4ms): git status
+SLOW_OP_LINE = re.compile(
+    rb"^(?:[^\n]*?(?P<day>\d{4}-\d{2}-\d{2}))?[^\n]*?SLOW OPERATION DETECTED\]?:?[ \t]*"
+    rb"(?P<op>[^\n]*?)[ \t]*[(\[]?(?:took[ \t]+)?(?P<duration>\d+(?:\.\d+)?)[ \t]*(?P<unit>ms|s)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+SLOW_OP_MAX_NAME = 80
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+def latency_stats(durations: List[float]) -> LatencyStats:
+    """Nearest-rank p50/p95/max of a list of durations in ms."""
+    if not durations:
+        return LatencyStats()
+    ordered = sorted(durations)
+
+    def rank(p: int) -> float:
+        return ordered[max(0, -(-p * len(ordered) // 100) - 1)]
+
+    return LatencyStats(len(ordered), rank(50), rank(95), ordered[-1])
+
+
+@dataclass
+class SlowOpsReport:
+    """Latency of SLOW OPERATION DETECTED lines across all debug logs."""
+    files_scanned: int = 0
+    total: int = 0
+    by_operation: Dict[str, LatencyStats] = field(default_factory=dict)
+    by_day: Dict[str, LatencyStats] = field(default_factory=dict)
+    by_operation_day: Dict[str, Dict[str, LatencyStats]] = field(default_factory=dict)
+
+
+def parse_slow_ops(path: Path) -> List[Tuple[str, str, float]]:
+    """Extract (day, operation, duration_ms) from one log file.
+
+    Lines without a date are attributed to the file's modification day.
+    """
+    fallback_day = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d")
+    ops: List[Tuple[str, str, float]] = []
+    for _, text in iter_line_chunks(path):
+        if b"SLOW OPERATION" not in text.upper():
+            continue
+        for m in SLOW_OP_LINE.finditer(text):
+            op = m.group("op").decode("utf-8", "replace").strip(" :-([")[:SLOW_OP_MAX_NAME] or "unknown"
+            duration = float(m.group("duration"))
+            if m.group("unit").lower() == b"s":
+                duration *= 1000
+            day = m.group("day").decode() if m.group("day") else fallback_day
+            ops.append((day, op, duration))
+    return ops
+
+
+def analyze_slow_ops(log_files: List[Path], workers: int = 1) -> SlowOpsReport:
+    """Parse slow-operation lines from many log files, in parallel across files."""
+    def parse(path: Path) -> List[Tuple[str, str, float]]:
+        try:
+            return parse_slow_ops(path)
+        except (PermissionError, OSError):
+            return []
+
+    if workers > 1 and len(log_files) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse, log_files))
+    else:
+        results = [parse(path) for path in log_files]
+
+    by_op: Dict[str, List[float]] = {}
+    by_day: Dict[str, List[float]] = {}
+    by_op_day: Dict[str, Dict[str, List[float]]] = {}
+    for ops in results:
+        for day, op, duration in ops:
+            by_op.setdefault(op, []).append(duration)
+            by_day.setdefault(day, []).append(duration)
+            by_op_day.setdefault(op, {}).setdefault(day, []).append(duration)
+
+    return SlowOpsReport(
+        files_scanned=len(log_files),
+        total=sum(len(ops) for ops in results),
+        by_operation={op: latency_stats(d) for op, d in sorted(by_op.items())},
+        by_day={day: latency_stats(d) for day, d in sorted(by_day.items())},
+        by_operation_day={
+            op: {day: latency_stats(d) for day, d in sorted(days.items())}
+            for op, days in sorted(by_op_day.items())
+        },
+    )
+
+
+# (name, pattern) pairs for detect_grove_timeout
+GROVE_LOG_PATTERNS = [
+    ("grove_notice", r"Grove notice config"),
+    ("grove_timeout", r"timeout.*grove"),
+    ("slow_operation", r"SLOW OPERATION DETECTED"),
+]
+
+
+# Written by cc-disk-fix.py: per-backup sizes at the backup root, and each backup's manifest
+BACKUP_INDEX_NAME = "index.json"
+BACKUP_MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class BackupUsage:
+    """Size of ~/.claude-backups as the backups themselves record it."""
+    size: int = 0
+    count: int = 0
+    walked: int = 0  # backups with no recorded size, measured by a walk
 
 
 def is_wsl() -> bool:
@@ -133,11 +979,47 @@ def is_wsl() -> bool:
 class ClaudeCodeScanner:
     """Main scanner class."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        use_cache: bool = True,
+        rebuild_cache: bool = False,
+        workers: int = 1,
+    ):
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.rebuild_cache = rebuild_cache
+        self.workers = workers
         self.home = Path.home()
         self.claude_dir = self._resolve_claude_dir()
         self.claude_json = self.home / ".claude.json"
+        self.backup_root = self.home / ".claude-backups"
+        # Kept outside the config dir so the cache never shows up in its own scan
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME") or self.home / ".cache")
+        self.index_cache = cache_home / "bluera-base" / "cc-disk-scan-index.json"
+        self._index: Optional[TreeIndex] = None
+        self.log_analyzer = LogAnalyzer()
+        self._register_log_patterns()
+        self._debug_log_stats: Optional[Dict[str, PatternStats]] = None
+        self._slow_ops: Optional[SlowOpsReport] = None
+        # Filled by detectors, consumed by generate_actions
+        self.candidates: Dict[str, CandidateSet] = {}
+        self._candidates_lock = threading.Lock()
+
+    @property
+    def index(self) -> TreeIndex:
+        """Tree index of the config dir, built on first use."""
+        if self._index is None:
+            self._log(f"Indexing {self.claude_dir}...")
+            self._index = TreeIndex(
+                self.claude_dir,
+                cache_path=self.index_cache if self.use_cache else None,
+                rebuild=self.rebuild_cache,
+                workers=self.workers,
+            )
+            self._log(f"Indexed: {self._index.scanned_dirs} dirs scanned, "
+                      f"{self._index.reused_dirs} reused from cache")
+        return self._index
 
     def _resolve_claude_dir(self) -> Path:
         """Resolve ~/.claude or $CLAUDE_CONFIG_DIR."""
@@ -146,6 +1028,93 @@ class ClaudeCodeScanner:
             return Path(config_dir)
         return self.home / ".claude"
 
+    def _register_log_patterns(self) -> None:
+        """Register every detector's debug log patterns with the shared analyzer."""
+        for name, pattern in GROVE_LOG_PATTERNS:  # detect_grove_timeout
+            self.log_analyzer.register(name, pattern)
+        self.log_analyzer.register(  # detect_wsl_powershell
+            "wsl_powershell", r"powershell\.exe.*USERPROFILE"
+        )
+
+    def slow_ops(self) -> SlowOpsReport:
+        """Slow-operation latency across every debug log, computed once per scan."""
+        if self._slow_ops is None:
+            self._log("Analyzing slow operations in debug logs...")
+            seen = set()
+            log_files = []
+            for path, _, _ in self.index.iter_files(self.claude_dir / "debug"):
+                real = os.path.realpath(path)  # debug/latest links to another log
+                if real not in seen:
+                    seen.add(real)
+                    log_files.append(Path(path))
+            self._slow_ops = analyze_slow_ops(log_files, self.workers)
+        return self._slow_ops
+
+    def backup_usage(self) -> BackupUsage:
+        """Size of every backup in ~/.claude-backups, as list-backups reports it.
+
+        Sizes come from the backup root's index.json, else from a backup's
+        manifest summary plus the dedup objects it references. Only a
+        backup with neither (an interrupted or very old one) is walked.
+        """
+        usage = BackupUsage()
+        if not self.backup_root.is_dir():
+            return usage
+        try:
+            with open(self.backup_root / BACKUP_INDEX_NAME, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        for entry in sorted(os.scandir(self.backup_root), key=lambda e: e.name):
+            if not entry.name.startswith("20") or not entry.is_dir(follow_symlinks=False):
+                continue
+            usage.count += 1
+            recorded = index.get(entry.name)
+            size = recorded.get("size") if isinstance(recorded, dict) else None
+            if size is None:
+                size = self._manifest_size(Path(entry.path))
+            if size is None:
+                path = Path(entry.path)
+                size = TreeIndex(path, workers=self.workers).size(path)
+                usage.walked += 1
+            usage.size += int(size)
+        return usage
+
+    def _manifest_size(self, backup_dir: Path) -> Optional[int]:
+        """A backup's size from its manifest summary and referenced objects, or None."""
+        try:
+            with open(backup_dir / BACKUP_MANIFEST_NAME, "r") as f:
+                manifest = json.load(f)
+            size = int(manifest["summary"]["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        objects = {str(e["backup"]) for e in manifest.get("files", []) if "sha256" in e}
+        for name in objects:
+            try:
+                size += (self.backup_root / name).stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def debug_log_stats(self) -> Optional[Dict[str, PatternStats]]:
+        """Pattern stats for debug/latest, analyzed once per scan (None if unreadable)."""
+        if self._debug_log_stats is None:
+            debug_latest = self.claude_dir / "debug" / "latest"
+            if not debug_latest.exists():
+                return None
+            try:
+                self._debug_log_stats = self.log_analyzer.analyze(debug_latest)
+            except (PermissionError, OSError):
+                return None
+        return self._debug_log_stats
+
+    def _offer(self, action_id: str, items: List[FilePreview]) -> CandidateSet:
+        """Record a detector's candidates for an action; detectors may run concurrently."""
+        candidates = CandidateSet(action_id, items)
+        with self._candidates_lock:
+            self.candidates[action_id] = candidates
+        return candidates
+
     def _log(self, msg: str) -> None:
         """Log message if verbose mode."""
         if self.verbose:
@@ -192,33 +1161,33 @@ class ClaudeCodeScanner:
         else:
             sizes["claude_json"] = 0
 
+        index = self.index
+
         # ~/.claude/ total size
-        sizes["claude_dir"] = get_dir_size(self.claude_dir)
+        sizes["claude_dir"] = index.size(self.claude_dir)
 
         # Plugin cache
         cache_dir = self.claude_dir / "plugins" / "cache"
-        sizes["plugin_cache"] = get_dir_size(cache_dir)
-        counts["plugin_cache_files"] = get_file_count(cache_dir)
+        sizes["plugin_cache"] = index.size(cache_dir)
+        counts["plugin_cache_files"] = index.file_count(cache_dir)
 
         # Projects
         projects_dir = self.claude_dir / "projects"
-        sizes["projects"] = get_dir_size(projects_dir)
-        counts["project_files"] = get_file_count(projects_dir)
+        sizes["projects"] = index.size(projects_dir)
+        counts["project_files"] = index.file_count(projects_dir)
 
         # Debug logs
         debug_dir = self.claude_dir / "debug"
-        sizes["debug"] = get_dir_size(debug_dir)
-        counts["debug_files"] = get_file_count(debug_dir)
+        sizes["debug"] = index.size(debug_dir)
+        counts["debug_files"] = index.file_count(debug_dir)
 
         # CLAUDE.md
-        claude_md = self.claude_dir / "CLAUDE.md"
-        if claude_md.exists():
-            sizes["claude_md"] = claude_md.stat().st_size
-        else:
-            sizes["claude_md"] = 0
+        claude_md = index.file_stat(self.claude_dir / "CLAUDE.md")
+        sizes["claude_md"] = claude_md[0] if claude_md else 0
 
         return {"sizes": sizes, "counts": counts}
 
+    @detector("metrics")
     def detect_claude_json_bloat(self, metrics: Dict) -> Optional[Finding]:
         """Detector: .claude.json size."""
         self._log("Checking .claude.json size...")
@@ -237,18 +1206,18 @@ class ClaudeCodeScanner:
         else:
             return None
 
-        # Try to count history entries (without printing values)
-        history_count = 0
+        # Profile the file in a streaming pass (without loading or printing values)
         try:
-            with open(self.claude_json, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Count various history-like keys
-                    for key in ["history", "conversations", "messages", "chats"]:
-                        if key in data and isinstance(data[key], list):
-                            history_count += len(data[key])
-        except (json.JSONDecodeError, PermissionError, OSError):
-            pass
+            profile = profile_claude_json(self.claude_json)
+        except (PermissionError, OSError):
+            profile = ClaudeJsonProfile()
+
+        # Count various history-like keys
+        history_count = sum(
+            profile.keys[key].entries
+            for key in ["history", "conversations", "messages", "chats"]
+            if key in profile.keys
+        )
 
         evidence = [
             Evidence("size_bytes", size),
@@ -257,17 +1226,37 @@ class ClaudeCodeScanner:
         if history_count > 0:
             evidence.append(Evidence("history_entries", history_count))
 
+        largest_keys = sorted(profile.keys.items(), key=lambda kv: kv[1].bytes, reverse=True)[:5]
+        if largest_keys:
+            evidence.append(Evidence("largest_keys", [
+                f"{key}: {format_size(stats.bytes)} ({stats.entries} entries)"
+                for key, stats in largest_keys
+            ]))
+
+        title = f"~/.claude.json = {format_size(size)} (likely history accumulation)"
+        largest_projects = sorted(profile.projects.items(), key=lambda kv: kv[1].bytes, reverse=True)[:5]
+        if largest_projects:
+            evidence.append(Evidence("largest_projects", [
+                f"{project}: {format_size(stats.bytes)} ({stats.entries} history entries)"
+                for project, stats in largest_projects
+            ]))
+            top_project, top_stats = largest_projects[0]
+            title = (f"~/.claude.json = {format_size(size)} "
+                     f"(largest: {top_project}, {format_size(top_stats.bytes)}, "
+                     f"{top_stats.entries} history entries)")
+
         return Finding(
             id="CLAUDE_JSON_BLOAT",
-            title=f"~/.claude.json = {format_size(size)} (likely history accumulation)",
+            title=title,
             risk=risk,
             evidence=evidence,
             why_it_matters="Large .claude.json causes slow startup and poor performance",
-            recommended_actions=["DELETE-auth-config"],
+            recommended_actions=["SLIM-claude-json", "DELETE-auth-config"],
             references=["#5024", "#5653", "#1449", "#6394"],
         )
 
-    def detect_plugin_cache(self, metrics: Dict) -> Optional[Finding]:
+    @detector("metrics", "tree_index")
+    def detect_plugin_cache(self, metrics: Dict, index: TreeIndex) -> Optional[Finding]:
         """Detector: plugin cache regression."""
         self._log("Checking plugin cache...")
 
@@ -277,6 +1266,13 @@ class ClaudeCodeScanner:
         if count == 0:
             return None
 
+        plugins = [
+            dir_preview(plugin)
+            for marketplace in index.subdirs(self.claude_dir / "plugins" / "cache")
+            for plugin in marketplace.dirs.values()
+        ]
+        self._offer("DELETE-plugin-cache", sorted(plugins, key=lambda p: p.size, reverse=True))
+
         # Cache presence is potentially problematic (known regression)
         risk = "medium"
         if size > 50 * 1024 * 1024:  # 50MB
@@ -296,31 +1292,16 @@ class ClaudeCodeScanner:
             references=["#15090"],
         )
 
-    def detect_grove_timeout(self) -> Optional[Finding]:
+    @detector("log_index")
+    def detect_grove_timeout(self, stats: Optional[Dict[str, PatternStats]]) -> Optional[Finding]:
         """Detector: Grove notice config timeout in debug logs."""
         self._log("Checking debug logs for Grove timeout...")
 
         debug_latest = self.claude_dir / "debug" / "latest"
-        if not debug_latest.exists():
-            return None
-
-        patterns = [
-            r"Grove notice config",
-            r"timeout.*grove",
-            r"SLOW OPERATION DETECTED",
-        ]
-
-        matches = []
-        try:
-            # Read only first 100KB of log
-            with open(debug_latest, "r", errors="ignore") as f:
-                content = f.read(100 * 1024)
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        matches.append(pattern)
-        except (PermissionError, OSError):
+        if stats is None:
             return None
 
+        matches = [pattern for name, pattern in GROVE_LOG_PATTERNS if stats[name].count]
         if not matches:
             return None
 
@@ -330,6 +1311,10 @@ class ClaudeCodeScanner:
             risk="high",
             evidence=[
                 Evidence("patterns_matched", matches),
+                Evidence("match_counts", [
+                    f"{pattern}: {stats[name].count}"
+                    for name, pattern in GROVE_LOG_PATTERNS if stats[name].count
+                ]),
                 Evidence("log_file", str(debug_latest)),
             ],
             why_it_matters="Startup blocks on failing/slow network fetch, adding 10-12s delay",
@@ -337,26 +1322,54 @@ class ClaudeCodeScanner:
             references=["#11442"],
         )
 
-    def detect_wsl_powershell(self) -> Optional[Finding]:
+    @detector("slow_ops")
+    def detect_slow_operations(self, report: SlowOpsReport) -> Optional[Finding]:
+        """Detector: slow-operation latency across all debug logs."""
+        self._log("Checking debug logs for slow operations...")
+
+        if report.total == 0:
+            return None
+
+        worst_p95 = max(stats.p95_ms for stats in report.by_operation.values())
+        if worst_p95 > 5000:
+            risk = "high"
+        elif worst_p95 > 1000:
+            risk = "medium"
+        else:
+            risk = "low"
+
+        slowest = sorted(report.by_operation.items(), key=lambda kv: kv[1].p95_ms, reverse=True)[:5]
+        return Finding(
+            id="SLOW_OPERATIONS",
+            title=f"Slow operations: {report.total} across {len(report.by_operation)} operations "
+                  f"(worst p95 {worst_p95:.0f}ms)",
+            risk=risk,
+            evidence=[
+                Evidence("count", report.total),
+                Evidence("log_files", report.files_scanned),
+                Evidence("slowest_operations", [
+                    f"{op}: n={stats.count} p50={stats.p50_ms:.0f}ms "
+                    f"p95={stats.p95_ms:.0f}ms max={stats.max_ms:.0f}ms"
+                    for op, stats in slowest
+                ]),
+            ],
+            why_it_matters="Slow filesystem, git or network operations delay startup and tool calls",
+            recommended_actions=["SHOW_SLOW_OPS"],
+            references=[],
+        )
+
+    @detector("log_index")
+    def detect_wsl_powershell(self, stats: Optional[Dict[str, PatternStats]]) -> Optional[Finding]:
         """Detector: WSL2 repeated PowerShell calls."""
         self._log("Checking for WSL PowerShell issues...")
 
         if not is_wsl():
             return None
 
-        debug_latest = self.claude_dir / "debug" / "latest"
-        if not debug_latest.exists():
+        if stats is None:
             return None
 
-        powershell_count = 0
-        try:
-            with open(debug_latest, "r", errors="ignore") as f:
-                content = f.read(100 * 1024)
-                powershell_count = len(re.findall(
-                    r"powershell\.exe.*USERPROFILE", content, re.IGNORECASE
-                ))
-        except (PermissionError, OSError):
-            return None
+        powershell_count = stats["wsl_powershell"].count
 
         if powershell_count < 3:
             return None
@@ -374,7 +1387,8 @@ class ClaudeCodeScanner:
             references=["#14352"],
         )
 
-    def detect_projects_bloat(self, metrics: Dict) -> Optional[Finding]:
+    @detector("metrics", "tree_index")
+    def detect_projects_bloat(self, metrics: Dict, index: TreeIndex) -> Optional[Finding]:
         """Detector: ~/.claude/projects storage bloat."""
         self._log("Checking projects directory size...")
 
@@ -384,6 +1398,8 @@ class ClaudeCodeScanner:
         if size < 500 * 1024 * 1024:  # 500MB threshold
             return None
 
+        self._offer("DELETE-old-sessions", self._collect_old_sessions(index, 30))
+
         risk = "medium"
         if size > 1024 * 1024 * 1024:  # 1GB
             risk = "high"
@@ -402,6 +1418,7 @@ class ClaudeCodeScanner:
             references=["#8722"],
         )
 
+    @detector("metrics")
     def detect_oversized_memory(self, metrics: Dict) -> Optional[Finding]:
         """Detector: Large CLAUDE.md or rules files."""
         self._log("Checking memory file sizes...")
@@ -424,33 +1441,23 @@ class ClaudeCodeScanner:
             references=[],
         )
 
-    def detect_orphaned_projects(self) -> Optional[Finding]:
+    @detector("tree_index")
+    def detect_orphaned_projects(self, index: TreeIndex) -> Optional[Finding]:
         """Detector: Projects whose original paths no longer exist."""
         self._log("Checking for orphaned projects...")
 
-        projects_dir = self.claude_dir / "projects"
-        if not projects_dir.exists():
-            return None
-
         orphaned = []
-        total_size = 0
-
-        try:
-            for project_dir in projects_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                # Convert -Users-chris-repos-foo → /Users/chris/repos/foo
-                original_path = "/" + project_dir.name.lstrip("-").replace("-", "/")
-                if not Path(original_path).is_dir():
-                    size = get_dir_size(project_dir)
-                    orphaned.append((str(project_dir), size))
-                    total_size += size
-        except (PermissionError, OSError):
-            return None
+        for project in index.subdirs(self.claude_dir / "projects"):
+            original_path = project_original_path(os.path.basename(project.path))
+            if not Path(original_path).is_dir():
+                orphaned.append(dir_preview(project))
 
         if not orphaned:
             return None
 
+        orphaned.sort(key=lambda p: p.size, reverse=True)
+        total_size = self._offer("DELETE-orphaned-projects", orphaned).total_size
+
         risk = "medium"
         if total_size > 1024 * 1024 * 1024:  # 1GB
             risk = "high"
@@ -469,40 +1476,19 @@ class ClaudeCodeScanner:
             references=[],
         )
 
-    def detect_old_plugin_versions(self) -> Optional[Finding]:
+    @detector("tree_index")
+    def detect_old_plugin_versions(self, index: TreeIndex) -> Optional[Finding]:
         """Detector: Multiple versions of plugins in cache."""
         self._log("Checking for old plugin versions...")
 
-        cache_dir = self.claude_dir / "plugins" / "cache"
-        if not cache_dir.exists():
-            return None
-
-        old_versions: List[Tuple[str, str, int]] = []  # (plugin_name, version, size)
-        total_size = 0
-
-        try:
-            for marketplace in cache_dir.iterdir():
-                if not marketplace.is_dir():
-                    continue
-                for plugin in marketplace.iterdir():
-                    if not plugin.is_dir():
-                        continue
-                    versions = [v for v in plugin.iterdir() if v.is_dir()]
-                    if len(versions) <= 1:
-                        continue
-                    # Sort by semver (best effort)
-                    versions.sort(key=lambda v: self._semver_key(v.name), reverse=True)
-                    # Mark all but the latest for deletion
-                    for old_ver in versions[1:]:
-                        size = get_dir_size(old_ver)
-                        old_versions.append((plugin.name, old_ver.name, size))
-                        total_size += size
-        except (PermissionError, OSError):
-            return None
+        old_versions = [dir_preview(old_ver) for _, old_ver in self._iter_old_plugin_versions(index)]
 
         if not old_versions:
             return None
 
+        old_versions.sort(key=lambda p: p.size, reverse=True)
+        total_size = self._offer("DELETE-old-plugin-versions", old_versions).total_size
+
         risk = "medium"
         if total_size > 5 * 1024 * 1024 * 1024:  # 5GB
             risk = "high"
@@ -521,6 +1507,23 @@ class ClaudeCodeScanner:
             references=[],
         )
 
+    def _iter_old_plugin_versions(self, index: TreeIndex) -> Iterator[Tuple[DirNode, DirNode]]:
+        """Yield (plugin, version) nodes for every version except the latest."""
+        cache_dir = self.claude_dir / "plugins" / "cache"
+        for marketplace in index.subdirs(cache_dir):
+            for plugin in marketplace.dirs.values():
+                for old_ver in self._old_versions(plugin):
+                    yield plugin, old_ver
+
+    def _old_versions(self, plugin: DirNode) -> List[DirNode]:
+        """All version dirs of a plugin except the latest."""
+        versions = list(plugin.dirs.values())
+        if len(versions) <= 1:
+            return []
+        # Sort by semver (best effort)
+        versions.sort(key=lambda v: self._semver_key(os.path.basename(v.path)), reverse=True)
+        return versions[1:]
+
     def _semver_key(self, version: str) -> Tuple[int, int, int]:
         """Convert version string to sortable tuple."""
         parts = version.lstrip("v").split(".")
@@ -533,7 +1536,8 @@ class ClaudeCodeScanner:
         except (ValueError, IndexError):
             return (0, 0, 0)
 
-    def detect_cache_dirs(self) -> Optional[Finding]:
+    @detector("tree_index")
+    def detect_cache_dirs(self, index: TreeIndex) -> Optional[Finding]:
         """Detector: Cache directories that can be safely cleaned."""
         self._log("Checking cache directories...")
 
@@ -545,19 +1549,19 @@ class ClaudeCodeScanner:
             ("session-env", self.claude_dir / "session-env"),
         ]
 
-        found = []
-        total_size = 0
-
+        found: List[Tuple[str, DirNode]] = []
         for name, path in cache_dirs:
-            if path.exists() and path.is_dir():
-                size = get_dir_size(path)
-                if size > 0:
-                    found.append((name, size))
-                    total_size += size
+            node = index.node(path)
+            if node and node.size > 0:
+                found.append((name, node))
+        total_size = sum(node.size for _, node in found)
 
         if not found or total_size < 1024 * 1024:  # 1MB threshold
             return None
 
+        previews = [dir_preview(node) for _, node in found]
+        self._offer("DELETE-cache-dirs", sorted(previews, key=lambda p: p.size, reverse=True))
+
         return Finding(
             id="CACHE_DIRS",
             title=f"Cache directories: {len(found)} dirs, {format_size(total_size)}",
@@ -573,161 +1577,131 @@ class ClaudeCodeScanner:
             references=[],
         )
 
+    @detector("tree_index", "backup_usage")
+    def detect_backup_bloat(self, index: TreeIndex, backups: BackupUsage) -> Optional[Finding]:
+        """Detector: ~/.claude-backups outgrowing the config dir it backs up."""
+        self._log("Checking backup directory size...")
+
+        size = backups.size
+        if size < 100 * 1024 * 1024:  # 100MB threshold
+            return None
+
+        claude_size = index.size(self.claude_dir)
+        ratio = size / claude_size if claude_size else float("inf")
+        if ratio < 0.5:
+            return None
+
+        count = backups.count
+        return Finding(
+            id="BACKUP_BLOAT",
+            title=f"~/.claude-backups = {format_size(size)} across {count} backups "
+                  f"({ratio:.1f}x the size of ~/.claude)",
+            risk="high" if ratio > 2 else "medium",
+            evidence=[
+                Evidence("size_bytes", size),
+                Evidence("size_human", format_size(size)),
+                Evidence("backup_count", count),
+                Evidence("claude_dir_size_bytes", claude_size),
+                Evidence("ratio", round(ratio, 2) if claude_size else -1),
+            ],
+            why_it_matters="Cleanup backups are never pruned automatically, so they grow with every run",
+            recommended_actions=["prune-backups"],
+            references=[],
+        )
+
+    @detector("tree_index")
+    def detect_leftover_trash(self, index: TreeIndex) -> Optional[Finding]:
+        """Detector: Staging dirs --background-delete left behind in ~/.claude/.trash."""
+        self._log("Checking for leftover staged deletes...")
+
+        # A purger may still be working on recent ones
+        cutoff = datetime.now().timestamp() - 3600
+        leftover = [node for node in index.subdirs(self.claude_dir / ".trash") if node.mtime < cutoff]
+        if not leftover:
+            return None
+
+        total_size = sum(node.size for node in leftover)
+        return Finding(
+            id="LEFTOVER_TRASH",
+            title=f"Unpurged staged deletes: {len(leftover)} dirs, {format_size(total_size)}",
+            risk="medium" if total_size > 1024 * 1024 * 1024 else "low",
+            evidence=[
+                Evidence("count", len(leftover)),
+                Evidence("size_bytes", total_size),
+                Evidence("size_human", format_size(total_size)),
+            ],
+            why_it_matters="A background purge was interrupted, so space already reported as freed is still in use",
+            recommended_actions=["purge-trash"],
+            references=[],
+        )
+
     def _get_file_age_days(self, path: Path) -> int:
         """Get file age in days."""
         if not path.exists():
             return 0
-        mtime = path.stat().st_mtime
-        age_seconds = datetime.now().timestamp() - mtime
-        return int(age_seconds / 86400)
-
-    def _collect_plugin_cache_files(self) -> List[FilePreview]:
-        """Collect plugin cache files for preview."""
-        cache_dir = self.claude_dir / "plugins" / "cache"
-        if not cache_dir.exists():
-            return []
-
-        previews = []
-        try:
-            for marketplace in cache_dir.iterdir():
-                if marketplace.is_dir():
-                    for plugin in marketplace.iterdir():
-                        if plugin.is_dir():
-                            size = get_dir_size(plugin)
-                            previews.append(FilePreview(
-                                path=str(plugin),
-                                size=size,
-                                size_human=format_size(size),
-                                age_days=self._get_file_age_days(plugin),
-                            ))
-        except (PermissionError, OSError):
-            pass
-        return sorted(previews, key=lambda p: p.size, reverse=True)
+        return age_days(path.stat().st_mtime)
 
-    def _collect_old_sessions(self, days: int = 30) -> List[FilePreview]:
+    def _collect_old_sessions(self, index: TreeIndex, days: int = 30) -> List[FilePreview]:
         """Collect session files older than N days."""
-        projects_dir = self.claude_dir / "projects"
-        if not projects_dir.exists():
-            return []
-
         previews = []
-        try:
-            for session_file in projects_dir.rglob("*.jsonl"):
-                age = self._get_file_age_days(session_file)
-                if age > days:
-                    size = session_file.stat().st_size
-                    previews.append(FilePreview(
-                        path=str(session_file),
-                        size=size,
-                        size_human=format_size(size),
-                        age_days=age,
-                    ))
-        except (PermissionError, OSError):
-            pass
+        for path, size, mtime in index.iter_files(self.claude_dir / "projects", ".jsonl"):
+            age = age_days(mtime)
+            if age > days:
+                previews.append(FilePreview(
+                    path=path,
+                    size=size,
+                    size_human=format_size(size),
+                    age_days=age,
+                    mtime=mtime,
+                ))
         return sorted(previews, key=lambda p: p.age_days, reverse=True)
 
     def _collect_old_debug_logs(self, days: int = 14) -> List[FilePreview]:
         """Collect debug log files older than N days."""
-        debug_dir = self.claude_dir / "debug"
-        if not debug_dir.exists():
-            return []
-
         previews = []
-        try:
-            for log_file in debug_dir.rglob("*"):
-                if log_file.is_file():
-                    age = self._get_file_age_days(log_file)
-                    if age > days:
-                        size = log_file.stat().st_size
-                        previews.append(FilePreview(
-                            path=str(log_file),
-                            size=size,
-                            size_human=format_size(size),
-                            age_days=age,
-                        ))
-        except (PermissionError, OSError):
-            pass
+        for path, size, mtime in self.index.iter_files(self.claude_dir / "debug"):
+            age = age_days(mtime)
+            if age > days:
+                previews.append(FilePreview(
+                    path=path,
+                    size=size,
+                    size_human=format_size(size),
+                    age_days=age,
+                    mtime=mtime,
+                ))
         return sorted(previews, key=lambda p: p.age_days, reverse=True)
 
-    def _collect_orphaned_projects(self) -> List[FilePreview]:
-        """Collect orphaned project directories."""
-        projects_dir = self.claude_dir / "projects"
-        if not projects_dir.exists():
-            return []
-
-        previews = []
-        try:
-            for project_dir in projects_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                # Convert -Users-chris-repos-foo → /Users/chris/repos/foo
-                original_path = "/" + project_dir.name.lstrip("-").replace("-", "/")
-                if not Path(original_path).is_dir():
-                    size = get_dir_size(project_dir)
-                    previews.append(FilePreview(
-                        path=str(project_dir),
-                        size=size,
-                        size_human=format_size(size),
-                        age_days=self._get_file_age_days(project_dir),
-                    ))
-        except (PermissionError, OSError):
-            pass
-        return sorted(previews, key=lambda p: p.size, reverse=True)
-
-    def _collect_old_plugin_versions(self) -> List[FilePreview]:
-        """Collect old plugin version directories."""
-        cache_dir = self.claude_dir / "plugins" / "cache"
-        if not cache_dir.exists():
-            return []
-
-        previews = []
-        try:
-            for marketplace in cache_dir.iterdir():
-                if not marketplace.is_dir():
-                    continue
-                for plugin in marketplace.iterdir():
-                    if not plugin.is_dir():
-                        continue
-                    versions = [v for v in plugin.iterdir() if v.is_dir()]
-                    if len(versions) <= 1:
-                        continue
-                    # Sort by semver (best effort)
-                    versions.sort(key=lambda v: self._semver_key(v.name), reverse=True)
-                    # Mark all but the latest for deletion
-                    for old_ver in versions[1:]:
-                        size = get_dir_size(old_ver)
-                        previews.append(FilePreview(
-                            path=str(old_ver),
-                            size=size,
-                            size_human=format_size(size),
-                            age_days=self._get_file_age_days(old_ver),
-                        ))
-        except (PermissionError, OSError):
-            pass
-        return sorted(previews, key=lambda p: p.size, reverse=True)
-
-    def _collect_cache_dirs(self) -> List[FilePreview]:
-        """Collect cache directories that can be cleaned."""
-        cache_dirs = [
-            self.claude_dir / "debug",
-            self.claude_dir / "shell-snapshots",
-            self.claude_dir / "paste-cache",
-            self.claude_dir / "todos",
-            self.claude_dir / "session-env",
-        ]
+    def disk_usage(self, index: TreeIndex) -> DiskUsage:
+        """Break the config dir down into plugin cache, projects and everything else."""
+        plugins: List[PluginUsage] = []
+        for marketplace in index.subdirs(self.claude_dir / "plugins" / "cache"):
+            for name, plugin in marketplace.dirs.items():
+                old_size = sum(v.size for v in self._old_versions(plugin))
+                plugins.append(PluginUsage(name, plugin.size, len(plugin.dirs), old_size))
+        plugins.sort(key=lambda p: p.size, reverse=True)
+
+        active = [0, 0]
+        orphaned = [0, 0]
+        for project in index.subdirs(self.claude_dir / "projects"):
+            original_path = project_original_path(os.path.basename(project.path))
+            bucket = active if Path(original_path).is_dir() else orphaned
+            bucket[0] += 1
+            bucket[1] += project.size
+
+        return DiskUsage(
+            total_size=index.size(self.claude_dir),
+            plugin_cache_size=sum(p.size for p in plugins),
+            plugins=plugins,
+            active_projects=active[0],
+            active_projects_size=active[1],
+            orphaned_projects=orphaned[0],
+            orphaned_projects_size=orphaned[1],
+        )
 
-        previews = []
-        for path in cache_dirs:
-            if path.exists() and path.is_dir():
-                size = get_dir_size(path)
-                if size > 0:
-                    previews.append(FilePreview(
-                        path=str(path),
-                        size=size,
-                        size_human=format_size(size),
-                        age_days=self._get_file_age_days(path),
-                    ))
-        return sorted(previews, key=lambda p: p.size, reverse=True)
+    def _candidates(self, action_id: str) -> List[FilePreview]:
+        """Candidates a detector offered for an action (empty if none did)."""
+        found = self.candidates.get(action_id)
+        return found.items if found else []
 
     def generate_actions(self, findings: List[Finding], metrics: MetricsInfo) -> List[RemediationAction]:
         """Generate action list from findings with file previews."""
@@ -759,13 +1733,35 @@ class ClaudeCodeScanner:
                 notes="Requires re-authentication after reset. Backup created in ~/.claude-backups/",
             ))
 
+        if "SLIM-claude-json" in action_ids:
+            size = metrics["sizes"].get("claude_json", 0)
+            previews = []
+            if self.claude_json.exists():
+                previews.append(FilePreview(
+                    path=str(self.claude_json),
+                    size=size,
+                    size_human=format_size(size),
+                    age_days=self._get_file_age_days(self.claude_json),
+                ))
+            actions.append(RemediationAction(
+                id="SLIM-claude-json",
+                title="Trim per-project history in ~/.claude.json (keeps auth)",
+                safety="caution",
+                affects=["history"],
+                fix_command="SLIM-claude-json --keep 50",
+                file_preview=previews,
+                total_size=size,
+                total_size_human=format_size(size),
+                notes="Keeps the newest 50 history entries per project. Backup created in ~/.claude-backups/",
+            ))
+
         if "DELETE-plugin-cache" in action_ids:
-            previews = self._collect_plugin_cache_files()
+            previews = self._candidates("DELETE-plugin-cache")
             total = sum(p.size for p in previews)
             actions.append(RemediationAction(
                 id="DELETE-plugin-cache",
                 title=f"Delete plugin cache ({len(previews)} plugins)",
-                safety="caution",
+                safety=ACTION_SAFETY["DELETE-plugin-cache"],
                 affects=["plugin_cache"],
                 fix_command="DELETE-plugin-cache",
                 file_preview=previews,
@@ -795,12 +1791,12 @@ class ClaudeCodeScanner:
             ))
 
         if "DELETE-old-sessions" in action_ids:
-            previews = self._collect_old_sessions(30)
+            previews = self._candidates("DELETE-old-sessions")
             total = sum(p.size for p in previews)
             actions.append(RemediationAction(
                 id="DELETE-old-sessions",
                 title=f"Delete old session files ({len(previews)} files >30 days)",
-                safety="destructive",
+                safety=ACTION_SAFETY["DELETE-old-sessions"],
                 affects=["session_data"],
                 fix_command="DELETE-old-sessions --days 30",
                 file_preview=previews,
@@ -815,7 +1811,7 @@ class ClaudeCodeScanner:
             actions.append(RemediationAction(
                 id="DELETE-debug-logs",
                 title=f"Delete old debug logs ({len(previews)} files >14 days)",
-                safety="safe",
+                safety=ACTION_SAFETY["DELETE-debug-logs"],
                 affects=["debug_logs"],
                 fix_command="DELETE-debug-logs --days 14",
                 file_preview=previews,
@@ -834,6 +1830,16 @@ class ClaudeCodeScanner:
                 notes="Informational only - see https://github.com/anthropics/claude-code/issues/14352",
             ))
 
+        if "SHOW_SLOW_OPS" in action_ids:
+            actions.append(RemediationAction(
+                id="SHOW_SLOW_OPS",
+                title="Show slow-operation latency by operation and day",
+                safety="info",
+                affects=[],
+                fix_command="",
+                notes="Informational - run cc-disk-scan.py --slow-ops for p50/p95/max per operation and day",
+            ))
+
         if "SUGGEST_TRIM_MEMORY" in action_ids:
             actions.append(RemediationAction(
                 id="SUGGEST_TRIM_MEMORY",
@@ -845,12 +1851,12 @@ class ClaudeCodeScanner:
             ))
 
         if "DELETE-orphaned-projects" in action_ids:
-            previews = self._collect_orphaned_projects()
+            previews = self._candidates("DELETE-orphaned-projects")
             total = sum(p.size for p in previews)
             actions.append(RemediationAction(
                 id="DELETE-orphaned-projects",
                 title=f"Delete orphaned projects ({len(previews)} dirs)",
-                safety="destructive",
+                safety=ACTION_SAFETY["DELETE-orphaned-projects"],
                 affects=["orphaned_projects"],
                 fix_command="DELETE-orphaned-projects",
                 file_preview=previews,
@@ -860,12 +1866,12 @@ class ClaudeCodeScanner:
             ))
 
         if "DELETE-old-plugin-versions" in action_ids:
-            previews = self._collect_old_plugin_versions()
+            previews = self._candidates("DELETE-old-plugin-versions")
             total = sum(p.size for p in previews)
             actions.append(RemediationAction(
                 id="DELETE-old-plugin-versions",
                 title=f"Delete old plugin versions ({len(previews)} versions)",
-                safety="caution",
+                safety=ACTION_SAFETY["DELETE-old-plugin-versions"],
                 affects=["old_plugin_versions"],
                 fix_command="DELETE-old-plugin-versions",
                 file_preview=previews,
@@ -874,13 +1880,33 @@ class ClaudeCodeScanner:
                 notes="Keeps latest version of each plugin. Running plugins may break!",
             ))
 
+        if "purge-trash" in action_ids:
+            actions.append(RemediationAction(
+                id="purge-trash",
+                title="Finish deleting staged data in ~/.claude/.trash",
+                safety="safe",
+                affects=["staged_deletes"],
+                fix_command="purge-trash",
+                notes="Everything here was already backed up and removed by an earlier cleanup",
+            ))
+
+        if "prune-backups" in action_ids:
+            actions.append(RemediationAction(
+                id="prune-backups",
+                title="Prune old cleanup backups in ~/.claude-backups",
+                safety="caution",
+                affects=["backups"],
+                fix_command="prune-backups --keep-last 5 --keep-weekly 4",
+                notes="Removed backups can no longer be restored. Run gc-backups afterwards if dedup backups are used",
+            ))
+
         if "DELETE-cache-dirs" in action_ids:
-            previews = self._collect_cache_dirs()
+            previews = self._candidates("DELETE-cache-dirs")
             total = sum(p.size for p in previews)
             actions.append(RemediationAction(
                 id="DELETE-cache-dirs",
                 title=f"Clear cache directories ({len(previews)} dirs)",
-                safety="safe",
+                safety=ACTION_SAFETY["DELETE-cache-dirs"],
                 affects=["cache_dirs"],
                 fix_command="DELETE-cache-dirs",
                 file_preview=previews,
@@ -895,27 +1921,26 @@ class ClaudeCodeScanner:
         """Run all detectors and generate report."""
         self._log("Starting scan...")
 
-        metrics = self.collect_metrics()
-        findings = []
-
-        # Run each detector
-        detectors = [
-            lambda: self.detect_claude_json_bloat(metrics),
-            lambda: self.detect_plugin_cache(metrics),
-            self.detect_grove_timeout,
-            self.detect_wsl_powershell,
-            lambda: self.detect_projects_bloat(metrics),
-            lambda: self.detect_oversized_memory(metrics),
-            self.detect_orphaned_projects,
-            self.detect_old_plugin_versions,
-            self.detect_cache_dirs,
-        ]
+        # Scan inputs, then every registered detector once its inputs are ready
+        tasks: Dict[str, ScanTask] = {
+            "tree_index": (lambda: self.index, ()),
+            "metrics": (lambda index: self.collect_metrics(), ("tree_index",)),
+            "log_index": (self.debug_log_stats, ()),
+            "slow_ops": (lambda index: self.slow_ops(), ("tree_index",)),
+            "backup_usage": (self.backup_usage, ()),
+            "disk_usage": (self.disk_usage, ("tree_index",)),
+        }
+        for spec in DETECTORS:
+            tasks[spec.name] = (getattr(self, spec.name), spec.inputs)
+        results, timings = run_task_graph(tasks, self.workers)
+        metrics: MetricsInfo = results["metrics"]  # type: ignore[assignment]
 
-        for detector in detectors:
-            finding = detector()
-            if finding:
+        findings = []
+        for spec in DETECTORS:
+            finding = results[spec.name]
+            if isinstance(finding, Finding):
                 findings.append(finding)
-                self._log(f"Found: {finding.id} ({finding.risk})")
+                self._log(f"Found: {finding.id} ({finding.risk}) in {timings[spec.name]}ms")
 
         # Sort by risk (critical first)
         risk_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
@@ -933,6 +1958,8 @@ class ClaudeCodeScanner:
             metrics=metrics,
             findings=findings,
             actions=actions,
+            disk_usage=results["disk_usage"],  # type: ignore[arg-type]
+            timings_ms=timings,
         )
 
 
@@ -953,121 +1980,89 @@ def generate_bar(fraction: float, width: int = 36) -> str:
     return "█" * filled + "░" * (width - filled)
 
 
-def print_disk_chart(scanner: "ClaudeCodeScanner") -> None:
-    """Print visual disk usage chart."""
-    # Collect sizes for each category
-    total_size = get_dir_size(scanner.claude_dir)
-
-    # Plugin cache breakdown
-    cache_dir = scanner.claude_dir / "plugins" / "cache"
-    plugin_sizes: Dict[str, Tuple[int, int]] = {}  # plugin_name: (size, version_count)
-    plugin_cache_total = 0
-
-    if cache_dir.exists():
-        try:
-            for marketplace in cache_dir.iterdir():
-                if not marketplace.is_dir():
-                    continue
-                for plugin in marketplace.iterdir():
-                    if not plugin.is_dir():
-                        continue
-                    versions = [v for v in plugin.iterdir() if v.is_dir()]
-                    size = get_dir_size(plugin)
-                    plugin_sizes[plugin.name] = (size, len(versions))
-                    plugin_cache_total += size
-        except (PermissionError, OSError):
-            pass
+def render_disk_chart(usage: DiskUsage) -> str:
+    """Render the disk usage chart, with recommendations, as text."""
+    total_size = usage.total_size
+    lines = [f"\n~/.claude/ Disk Usage ({format_size(total_size)})", "═" * 62, ""]
 
-    # Projects breakdown
-    projects_dir = scanner.claude_dir / "projects"
-    active_projects = 0
-    orphaned_projects = 0
-    active_size = 0
-    orphaned_size = 0
-
-    if projects_dir.exists():
-        try:
-            for project_dir in projects_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                original_path = "/" + project_dir.name.lstrip("-").replace("-", "/")
-                size = get_dir_size(project_dir)
-                if Path(original_path).is_dir():
-                    active_projects += 1
-                    active_size += size
-                else:
-                    orphaned_projects += 1
-                    orphaned_size += size
-        except (PermissionError, OSError):
-            pass
-
-    projects_total = active_size + orphaned_size
-
-    # Other directories
-    other_size = total_size - plugin_cache_total - projects_total
-
-    # Print chart
-    print(f"\n~/.claude/ Disk Usage ({format_size(total_size)})")
-    print("═" * 62)
-    print()
+    def section(label: str, size: int) -> str:
+        fraction = size / total_size if total_size > 0 else 0
+        return f"{label:<18}{generate_bar(fraction)}  {format_size(size):>8} ({fraction * 100:.0f}%)"
 
     # Plugin cache section
-    if plugin_cache_total > 0:
-        pct = (plugin_cache_total / total_size * 100) if total_size > 0 else 0
-        bar = generate_bar(plugin_cache_total / total_size if total_size > 0 else 0)
-        print(f"plugins/cache     {bar}  {format_size(plugin_cache_total):>8} ({pct:.0f}%)")
-
+    if usage.plugin_cache_size > 0:
+        lines.append(section("plugins/cache", usage.plugin_cache_size))
         # Top plugins by size
-        sorted_plugins = sorted(plugin_sizes.items(), key=lambda x: x[1][0], reverse=True)
-        for plugin_name, (size, version_count) in sorted_plugins[:3]:
-            version_note = f"({version_count} versions)" if version_count > 1 else ""
-            print(f"  └─ {plugin_name} {version_note}".ljust(50) + f"{format_size(size):>10}")
-        if len(sorted_plugins) > 3:
-            other_plugins_size = sum(s for _, (s, _) in sorted_plugins[3:])
-            print(f"  └─ other".ljust(50) + f"{format_size(other_plugins_size):>10}")
-        print()
+        for plugin in usage.plugins[:3]:
+            version_note = f"({plugin.versions} versions)" if plugin.versions > 1 else ""
+            lines.append(f"  └─ {plugin.name} {version_note}".ljust(50) + f"{format_size(plugin.size):>10}")
+        if len(usage.plugins) > 3:
+            other_plugins_size = sum(p.size for p in usage.plugins[3:])
+            lines.append("  └─ other".ljust(50) + f"{format_size(other_plugins_size):>10}")
+        lines.append("")
 
     # Projects section
-    if projects_total > 0:
-        pct = (projects_total / total_size * 100) if total_size > 0 else 0
-        bar = generate_bar(projects_total / total_size if total_size > 0 else 0)
-        print(f"projects/         {bar}  {format_size(projects_total):>8} ({pct:.0f}%)")
-        print(f"  └─ active ({active_projects} dirs)".ljust(50) + f"{format_size(active_size):>10}")
-        print(f"  └─ orphaned ({orphaned_projects} dirs)".ljust(50) + f"{format_size(orphaned_size):>10}")
-        print()
+    if usage.projects_size > 0:
+        lines.append(section("projects/", usage.projects_size))
+        lines.append(f"  └─ active ({usage.active_projects} dirs)".ljust(50)
+                     + f"{format_size(usage.active_projects_size):>10}")
+        lines.append(f"  └─ orphaned ({usage.orphaned_projects} dirs)".ljust(50)
+                     + f"{format_size(usage.orphaned_projects_size):>10}")
+        lines.append("")
 
     # Other section
-    if other_size > 0:
-        pct = (other_size / total_size * 100) if total_size > 0 else 0
-        bar = generate_bar(other_size / total_size if total_size > 0 else 0)
-        print(f"other/            {bar}  {format_size(other_size):>8} ({pct:.0f}%)")
-        print(f"  └─ telemetry, debug, cache, plans, tasks")
-        print()
+    if usage.other_size > 0:
+        lines.append(section("other/", usage.other_size))
+        lines.append("  └─ telemetry, debug, cache, plans, tasks")
+        lines.append("")
 
-    print("═" * 62)
+    lines.append("═" * 62)
 
     # Recommendations
     recommendations = []
-    if orphaned_size > 10 * 1024 * 1024:  # 10MB
-        recommendations.append(f"DELETE-orphaned-projects: Remove {orphaned_projects} dirs, free ~{format_size(orphaned_size)}")
-
-    old_versions_size = 0
-    for plugin_name, (size, version_count) in plugin_sizes.items():
-        if version_count > 1:
-            # Estimate size of old versions (all but latest)
-            old_versions_size += size * (version_count - 1) // version_count
-
-    if old_versions_size > 100 * 1024 * 1024:  # 100MB
-        recommendations.append(f"DELETE-old-plugin-versions: Keep only latest, free ~{format_size(old_versions_size)}")
+    if usage.orphaned_projects_size > 10 * 1024 * 1024:  # 10MB
+        recommendations.append(f"DELETE-orphaned-projects: Remove {usage.orphaned_projects} dirs, "
+                               f"free ~{format_size(usage.orphaned_projects_size)}")
+    if usage.old_versions_size > 100 * 1024 * 1024:  # 100MB
+        recommendations.append(f"DELETE-old-plugin-versions: Keep only latest, "
+                               f"free ~{format_size(usage.old_versions_size)}")
 
     if recommendations:
-        print("Recommendations:")
-        for rec in recommendations:
-            print(f"  • {rec}")
-        print(f"  • Run `/disk --clean` for interactive cleanup")
+        lines.append("Recommendations:")
+        lines.extend(f"  • {rec}" for rec in recommendations)
+        lines.append("  • Run `/disk --clean` for interactive cleanup")
     else:
-        print("No cleanup recommendations. Disk usage looks healthy!")
+        lines.append("No cleanup recommendations. Disk usage looks healthy!")
+
+    lines.append("")
+    return "\n".join(lines)
 
+
+def print_slow_ops(report: SlowOpsReport) -> None:
+    """Print slow-operation latency per operation and per day."""
+    print(f"\nSlow operations ({report.total} in {report.files_scanned} debug logs)")
+    print("═" * 62)
+    if report.total == 0:
+        print("No SLOW OPERATION DETECTED lines found.\n")
+        return
+
+    def row(label: str, stats: LatencyStats) -> str:
+        return (f"  {label[:30]:<30} {stats.count:>5} {stats.p50_ms:>7.0f} "
+                f"{stats.p95_ms:>7.0f} {stats.max_ms:>7.0f}")
+
+    header = f"  {'':<30} {'n':>5} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}"
+    print("\nBy operation (slowest p95 first):")
+    print(header)
+    for op, stats in sorted(report.by_operation.items(), key=lambda kv: kv[1].p95_ms, reverse=True):
+        print(row(op, stats))
+
+    print("\nBy day:")
+    print(header)
+    for day, stats in report.by_day.items():
+        print(row(day, stats))
+        for op, days in report.by_operation_day.items():
+            if day in days:
+                print(row(f"  {op}", days[day]))
     print()
 
 
@@ -1079,17 +2074,40 @@ def main() -> None:
                         help="Enable verbose output")
     parser.add_argument("--json", action="store_true",
                         help="Output raw JSON (for scripting)")
+    parser.add_argument("--chart", action="store_true",
+                        help="With --json, also include the rendered disk chart as \"chart\"")
+    parser.add_argument("--slow-ops", action="store_true",
+                        help="Report slow-operation latency per operation and day")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Neither read nor write the directory index cache")
+    parser.add_argument("--rebuild-cache", action="store_true",
+                        help="Ignore the directory index cache and rebuild it")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads for walking independent subtrees (default: {DEFAULT_WORKERS})")
     args = parser.parse_args()
 
-    scanner = ClaudeCodeScanner(verbose=args.verbose)
+    scanner = ClaudeCodeScanner(
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        workers=max(1, args.workers),
+    )
 
-    if args.json:
+    if args.slow_ops:
+        slow_ops = scanner.slow_ops()
+        if args.json:
+            print(json.dumps(to_dict(slow_ops), indent=2))
+        else:
+            print_slow_ops(slow_ops)
+    elif args.json:
         report = scanner.scan()
         report_dict = to_dict(report)
+        if args.chart and report.disk_usage is not None:
+            report_dict["chart"] = render_disk_chart(report.disk_usage)  # type: ignore[index]
         print(json.dumps(report_dict, indent=2))
     else:
         # Default: show disk usage chart
-        print_disk_chart(scanner)
+        print(render_disk_chart(scanner.disk_usage(scanner.index)))
 
 
 if __name__ == "__main__":